@@ -1,10 +1,13 @@
-from PySide6.QtWidgets import QApplication, QMainWindow, QTableWidgetItem
+from PySide6.QtWidgets import QApplication, QMainWindow
 from PySide6.QtGui import QIntValidator, QDoubleValidator
-from ui.calculator_ui import Ui_MainWindow
-from controller.input_parser import parse_common_inputs
-from controller.pricing_service import PricingService
-from controller.display_result import TableManager
+from ..ui.calculator_ui import Ui_MainWindow
+from .input_parser import parse_common_inputs
+from .pricing_service import PricingService
+from .display_result import TableManager
+from .progressive_runner import ProgressiveRunner
+from .sweep_chart import SweepChart
 import sys
+import threading
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -13,7 +16,11 @@ class MainWindow(QMainWindow):
         self.ui.setupUi(self)
         
         # Initialize managers
-        self.table_manager = TableManager(self.ui.tableWidget)
+        self.table_manager = TableManager(self.ui.tableView)
+        self.progressive = ProgressiveRunner(self.table_manager, self)
+        self.ui.Stop_Button.clicked.connect(lambda: self.progressive.stop())
+        self.sweep_chart = SweepChart(self.ui.chartContainer, self.ui.ChartParameter_ComboBox,
+                                      self.ui.ChartQuantity_ComboBox)
         
         # Option Style Radio Buttons
         self.ui.EuropeanStyle_RadioButton.toggled.connect(self.on_option_style_changed)   # European
@@ -77,12 +84,13 @@ class MainWindow(QMainWindow):
             self.ui.BS_CheckBox.setEnabled(True)
             self.ui.MC_CheckBox.setEnabled(True)
             self.update_bt_results()
+        self.update_chart()
 
     def on_bs_checkbox_changed(self):  # Black-Scholes
         if self.ui.BS_CheckBox.isChecked():
             self.update_bs_results()
         else:
-            self.table_manager.clear_column(0)
+            self.clear_column(0)
             
     def on_bt_checkbox_changed(self):  # Binomial Tree
         checked = self.ui.BT_CheckBox.isChecked()
@@ -90,7 +98,7 @@ class MainWindow(QMainWindow):
         if checked:
             self.update_bt_results()
         else:
-            self.table_manager.clear_column(1)
+            self.clear_column(1)
             
     def on_mc_checkbox_changed(self):  # Monte Carlo
         checked = self.ui.MC_CheckBox.isChecked()
@@ -98,7 +106,15 @@ class MainWindow(QMainWindow):
         if checked:
             self.update_mc_results()
         else:
-            self.table_manager.clear_column(2)
+            self.clear_column(2)
+
+    def clear_column(self, col):
+        self.progressive.stop(col)
+        self.table_manager.clear_column(col)
+
+    def closeEvent(self, event):
+        self.progressive.close(wait=False)
+        super().closeEvent(event)
 
     def update_all_results(self):
         try:
@@ -106,14 +122,25 @@ class MainWindow(QMainWindow):
             self.update_bs_results(params)
             self.update_bt_results(params)
             self.update_mc_results(params)
+            self.update_chart(params)
+        except (ValueError, Exception):
+            self.clear_column(0)
+            self.clear_column(1)
+            self.clear_column(2)
+            self.sweep_chart.clear()
+
+    def update_chart(self, params=None):  # Sensitivity chart
+        try:
+            if params is None:
+                params = parse_common_inputs(self.ui)
+            style = 'american' if self.ui.AmericanStyle_RadioButton.isChecked() else 'european'
+            self.sweep_chart.update(params, style)
         except (ValueError, Exception):
-            self.table_manager.clear_column(0)
-            self.table_manager.clear_column(1)
-            self.table_manager.clear_column(2)
+            self.sweep_chart.clear()
 
     def update_bs_results(self, params=None):  # Black-Scholes column (0)
         if not self.ui.BS_CheckBox.isChecked():
-            self.table_manager.clear_column(0)
+            self.clear_column(0)
             return
         
         try:
@@ -123,13 +150,13 @@ class MainWindow(QMainWindow):
             if prices:
                 self.table_manager.update_column(0, prices['call'], prices['put'])
             else:
-                self.table_manager.clear_column(0)
+                self.clear_column(0)
         except (ValueError, Exception):
-            self.table_manager.clear_column(0)
+            self.clear_column(0)
 
     def update_bt_results(self, params=None):  # Binomial Tree column (1)
         if not self.ui.BT_CheckBox.isChecked():
-            self.table_manager.clear_column(1)
+            self.clear_column(1)
             return
         
         try:
@@ -138,17 +165,16 @@ class MainWindow(QMainWindow):
             time_steps = int(self.ui.TimeStep_Input.text())
             style = 'american' if self.ui.AmericanStyle_RadioButton.isChecked() else 'european'
             
-            prices = PricingService.calculate_bt(params, time_steps, style)
-            if prices:
-                self.table_manager.update_column(1, prices['call'], prices['put'])
-            else:
-                self.table_manager.clear_column(1)
+            # Stream refining estimates; the first appears after a few milliseconds
+            cancel = threading.Event()
+            self.progressive.start(1, PricingService.calculate_bt_progressive(params, time_steps, style, cancel),
+                                   cancel)
         except (ValueError, Exception):
-            self.table_manager.clear_column(1)
+            self.clear_column(1)
 
     def update_mc_results(self, params=None):  # Monte Carlo column (2)
         if not self.ui.MC_CheckBox.isChecked():
-            self.table_manager.clear_column(2)
+            self.clear_column(2)
             return
         
         try:
@@ -156,13 +182,10 @@ class MainWindow(QMainWindow):
                 params = parse_common_inputs(self.ui)
             num_sim = int(self.ui.NumSim_Input.text())
             
-            prices = PricingService.calculate_mc(params, num_sim)
-            if prices:
-                self.table_manager.update_column(2, prices['call'], prices['put'])
-            else:
-                self.table_manager.clear_column(2)
+            cancel = threading.Event()
+            self.progressive.start(2, PricingService.calculate_mc_progressive(params, num_sim, cancel), cancel)
         except (ValueError, Exception):
-            self.table_manager.clear_column(2)
+            self.clear_column(2)
 
 # if __name__ == "__main__":
 #     app = QApplication(sys.argv)
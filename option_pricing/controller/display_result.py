@@ -1,28 +1,51 @@
-from PySide6.QtWidgets import QTableWidgetItem
+import numpy as np
+from PySide6.QtWidgets import QHeaderView
+from .results_model import ResultsTableModel
+
+ROW_LABELS = ["Call Price", "Put Price"]
+COLUMN_LABELS = ["Black Scholes", "Binomial Tree", "Monte Carlo"]
+
 
 class TableManager:
     """Manages updates to the pricing results table."""
     
-    def __init__(self, table_widget):
-        """Initialize with reference to QTableWidget."""
-        self.table = table_widget
+    def __init__(self, table_view):
+        """Initialize with reference to QTableView and attach a results model."""
+        self.table = table_view
+        self.model = ResultsTableModel(np.full((len(ROW_LABELS), len(COLUMN_LABELS)), np.nan),
+                                       ROW_LABELS, COLUMN_LABELS, parent=table_view)
+        self.table.setModel(self.model)
+        configure_view(self.table)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
     
-    def update_column(self, col, call_price, put_price):
+    def update_column(self, col, call_price, put_price, call_error=np.nan, put_error=np.nan):
         """Update a column with call and put prices.
         
         Args:
             col: int column index (0=BS, 1=BT, 2=MC)
-            call_price: float or str for call price
-            put_price: float or str for put price
+            call_price: float call price
+            put_price: float put price
+            call_error, put_error: float error bars shown next to the
+                prices, NaN for none
         """
-        self.table.setItem(0, col, QTableWidgetItem(str(call_price)))
-        self.table.setItem(1, col, QTableWidgetItem(str(put_price)))
+        self.model.set_column(col, [call_price, put_price], [call_error, put_error])
     
     def clear_column(self, col):
-        """Clear a column (set to empty strings).
+        """Clear a column (cells shown empty).
         
         Args:
             col: int column index (0=BS, 1=BT, 2=MC)
         """
-        self.table.setItem(0, col, QTableWidgetItem(""))
-        self.table.setItem(1, col, QTableWidgetItem(""))
\ No newline at end of file
+        self.model.set_column(col, np.nan)
+
+
+def configure_view(view):
+    """Set up a table view for large ResultsTableModel tables.
+
+    Fixed row heights stop the view from measuring every row, so scrolling
+    and updates stay cheap at 100k+ rows.
+    """
+    vertical = view.verticalHeader()
+    vertical.setSectionResizeMode(QHeaderView.Fixed)
+    vertical.setDefaultSectionSize(view.fontMetrics().height() + 6)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
@@ -0,0 +1,295 @@
+import json
+import time
+from dataclasses import dataclass
+from math import ceil, exp, log, sqrt
+
+import numpy as np
+from scipy.stats import norm
+
+from ..core import bs_price, bt_price, mc_price, mc_shard
+
+ENGINES = ('bs', 'bt', 'mc')
+
+# Resolution limits for the automatic mode.
+MIN_STEPS, MAX_STEPS = 10, 20000
+MIN_PATHS, MAX_PATHS = 1000, 100_000_000
+
+# Monte Carlo errors are 95% confidence half-widths.
+MC_Z = 1.96
+
+# Starting coefficients, measured with CostModel.calibrate() on a single
+# core; calibrate() and record() adapt them to the machine at hand.
+#   *_time        seconds per call (bs), per node = steps^2 (bt), per path (mc)
+#   *_overhead    fixed seconds per bt_price / mc_price call
+#   bt_error      |bt - exact| * steps / (S * sigma * sqrt(T) * max(pdf(d1), PDF_FLOOR))
+#   mc_error      antithetic standard deviation per pair / plain payoff standard deviation
+DEFAULT_COEFFICIENTS = {
+    'bs_time': 1e-4,
+    'bt_european_time': 1e-10,
+    'bt_american_time': 7.5e-9,
+    'bt_european_overhead': 5e-6,
+    'bt_american_overhead': 5e-6,
+    'mc_time': 2.5e-8,
+    'mc_overhead': 1e-5,
+    'bt_error': 0.28,
+    'mc_error': 0.67,
+}
+
+PDF_FLOOR = 0.02
+
+# Weight of each new timing observation in record().
+LEARNING_RATE = 0.2
+
+
+@dataclass
+class EngineChoice:
+    """Engine and resolution picked for a contract, with the model's predictions."""
+    engine: str
+    resolution: int | None  # steps (bt), paths (mc) or None (bs)
+    estimated_error: float
+    estimated_time: float
+
+
+class CostModel:
+    """Predicts error and run time of each engine for a contract.
+
+    Errors follow the usual convergence rates: binomial error falls as
+    1/steps, scaled by S*sigma*sqrt(T) and the normal density at d1 (largest
+    at the money, small deep in or out of the money); Monte Carlo error falls
+    as 1/sqrt(paths), scaled by the closed-form standard deviation of the
+    discounted payoff. Run times are a fixed per-call overhead plus a cost
+    linear in nodes (steps^2) or paths.
+    """
+
+    def __init__(self, coefficients: dict[str, float] | None = None):
+        self.coefficients = dict(DEFAULT_COEFFICIENTS)
+        if coefficients:
+            self.coefficients.update(coefficients)
+        self._seen: set[tuple[str, str]] = set()
+
+    # Predictions
+
+    def available_engines(self, style: str) -> tuple[str, ...]:
+        # Black-Scholes and the Monte Carlo engine price European exercise only.
+        return ENGINES if style == 'european' else ('bt',)
+
+    def estimate_error(self, engine: str, params: dict[str, float], option_type: int, style: str,
+                       resolution: int | None) -> float:
+        c = self.coefficients
+        if engine == 'bs':
+            return 0.0
+        if engine == 'bt':
+            return c['bt_error'] * _bt_error_scale(params) / resolution
+        if engine == 'mc':
+            return MC_Z * c['mc_error'] * _payoff_std(params, option_type) / sqrt(max(resolution // 2, 1))
+        raise ValueError(f"Unknown engine: {engine!r}.")
+
+    def estimate_time(self, engine: str, style: str, resolution: int | None) -> float:
+        fixed, variable, _ = self._time_terms(engine, style, resolution)
+        return fixed + variable
+
+    def _time_terms(self, engine, style, resolution):
+        # (fixed overhead, resolution-dependent time, name of its coefficient)
+        c = self.coefficients
+        if engine == 'bs':
+            return 0.0, c['bs_time'], 'bs_time'
+        if engine == 'bt':
+            return c[f'bt_{style}_overhead'], c[f'bt_{style}_time'] * resolution**2, f'bt_{style}_time'
+        if engine == 'mc':
+            return c['mc_overhead'], c['mc_time'] * resolution, 'mc_time'
+        raise ValueError(f"Unknown engine: {engine!r}.")
+
+    def resolution_for_error(self, engine: str, params: dict[str, float], option_type: int,
+                             target_error: float) -> int | None:
+        """Smallest resolution predicted to reach target_error (clamped to the limits)."""
+        c = self.coefficients
+        if engine == 'bs':
+            return None
+        # The ceil can land one short when rounding leaves the predicted error
+        # a hair above the target, so step up until estimate_error agrees.
+        if engine == 'bt':
+            scale = c['bt_error'] * _bt_error_scale(params)
+            steps = ceil(scale / target_error)
+            while steps < MAX_STEPS and scale / steps > target_error:
+                steps += 1
+            return int(min(max(steps, MIN_STEPS), MAX_STEPS))
+        if engine == 'mc':
+            scale = MC_Z * c['mc_error'] * _payoff_std(params, option_type)
+            pairs = ceil((scale / target_error)**2)
+            while 2 * pairs < MAX_PATHS and scale / sqrt(pairs) > target_error:
+                pairs += 1
+            return int(min(max(2 * pairs, MIN_PATHS), MAX_PATHS))
+        raise ValueError(f"Unknown engine: {engine!r}.")
+
+    def resolution_for_time(self, engine: str, style: str, time_budget: float) -> int | None:
+        """Largest resolution predicted to finish within time_budget (clamped to the limits)."""
+        c = self.coefficients
+        if engine == 'bs':
+            return None
+        if engine == 'bt':
+            steps = int(sqrt(max(time_budget - c[f'bt_{style}_overhead'], 0.0) / c[f'bt_{style}_time']))
+            return min(max(steps, MIN_STEPS), MAX_STEPS)
+        if engine == 'mc':
+            paths = int(max(time_budget - c['mc_overhead'], 0.0) / c['mc_time'])
+            return min(max(paths, MIN_PATHS), MAX_PATHS)
+        raise ValueError(f"Unknown engine: {engine!r}.")
+
+    def choose(self, params: dict[str, float], option_type: int, style: str, target_error: float,
+               time_budget: float, engines: tuple[str, ...] | None = None) -> EngineChoice:
+        """Pick the cheapest engine and resolution predicted to meet target_error.
+
+        If no candidate meets the target within time_budget, picks the one with
+        the smallest predicted error that fits the budget (or, failing that,
+        the fastest one).
+
+        Raises:
+            ValueError: If none of the requested engines can price this style.
+        """
+        allowed = [e for e in self.available_engines(style) if engines is None or e in engines]
+        if not allowed:
+            raise ValueError(f"No engine in {engines} can price {style} options.")
+
+        candidates = []
+        for engine in allowed:
+            resolution = self.resolution_for_error(engine, params, option_type, target_error)
+            candidates.append(self._choice(engine, params, option_type, style, resolution))
+            # Best accuracy the budget allows, for when the target is out of reach
+            resolution = self.resolution_for_time(engine, style, time_budget)
+            candidates.append(self._choice(engine, params, option_type, style, resolution))
+
+        in_budget = [c for c in candidates if c.estimated_time <= time_budget]
+        meeting = [c for c in in_budget if c.estimated_error <= target_error]
+        if meeting:
+            return min(meeting, key=lambda c: c.estimated_time)
+        if in_budget:
+            return min(in_budget, key=lambda c: (c.estimated_error, c.estimated_time))
+        return min(candidates, key=lambda c: c.estimated_time)
+
+    def _choice(self, engine, params, option_type, style, resolution):
+        return EngineChoice(engine, resolution,
+                            self.estimate_error(engine, params, option_type, style, resolution),
+                            self.estimate_time(engine, style, resolution))
+
+    # Learning
+
+    def record(self, engine: str, style: str, resolution: int | None, elapsed: float) -> None:
+        """Fold an observed run time into the time coefficients.
+
+        Only the resolution-dependent coefficient is updated, from the time
+        left after the fixed overhead. Runs where the overhead is predicted
+        to dominate say little about that coefficient and are skipped, as is
+        the first observation of each engine/style in a process, since it
+        includes JIT compilation.
+        """
+        key = (engine, style)
+        if key not in self._seen:
+            self._seen.add(key)
+            return
+        fixed, variable, name = self._time_terms(engine, style, resolution)
+        if variable <= fixed or elapsed <= fixed:
+            return
+        # Geometric moving average of observed/predicted variable time.
+        factor = exp(LEARNING_RATE * log((elapsed - fixed) / variable))
+        self.coefficients[name] *= factor
+
+    def calibrate(self, repeats: int = 3) -> dict[str, float]:
+        """Re-fit every coefficient from benchmark runs on this machine.
+
+        Takes a few seconds. Returns the new coefficients.
+        """
+        c = self.coefficients
+        base = {'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.05, 'sigma': 0.2}
+        args = tuple(base.values())
+
+        # Warm up the JIT before timing anything.
+        bt_price(*args, 10, 1, 'european')
+        bt_price(*args, 10, 1, 'american')
+        mc_price(*args, 1000, 1)
+        mc_shard(*args, 1000, 0)
+
+        c['bs_time'] = _best_time(lambda: bs_price(*args, 1), repeats)
+        for style in ('european', 'american'):
+            steps = 2000
+            c[f'bt_{style}_overhead'] = _best_time(lambda: bt_price(*args, 2, 1, style), repeats)
+            total = _best_time(lambda: bt_price(*args, steps, 1, style), repeats)
+            c[f'bt_{style}_time'] = max(total - c[f'bt_{style}_overhead'], 0.0) / steps**2
+        c['mc_overhead'] = _best_time(lambda: mc_price(*args, 2, 1), repeats)
+        paths = 4_000_000
+        c['mc_time'] = max(_best_time(lambda: mc_price(*args, paths, 1), repeats) - c['mc_overhead'], 0.0) / paths
+
+        # Error coefficients over a grid of moneyness, maturity and volatility.
+        bt_ratios, mc_ratios = [], []
+        for K in (80.0, 100.0, 120.0):
+            for T in (0.25, 1.0, 2.0):
+                for sigma in (0.2, 0.4):
+                    params = dict(base, K=K, T=T, sigma=sigma)
+                    contract = (params['S'], K, T, params['r'], sigma)
+                    for option_type in (1, 0):
+                        exact = bs_price(*contract, option_type)
+                        for steps in (50, 100, 200, 400):
+                            error = abs(bt_price(*contract, steps, option_type, 'european') - exact)
+                            bt_ratios.append(error * steps / _bt_error_scale(params))
+                        stats = mc_shard(*contract, 20000, seed=len(mc_ratios), option_type=option_type)
+                        payoff_std = _payoff_std(params, option_type)
+                        if payoff_std > 0:
+                            mc_ratios.append(stats.stderrs()['Price'] * sqrt(stats.count) / payoff_std)
+        # Conservative: most contracts come in below the predicted error.
+        c['bt_error'] = float(np.percentile(bt_ratios, 90))
+        c['mc_error'] = float(np.percentile(mc_ratios, 90))
+        return dict(c)
+
+    # Persistence
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.coefficients, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'CostModel':
+        with open(path) as f:
+            return cls(json.load(f))
+
+
+def _d1(params):
+    S, K, T, r, sigma = (params[k] for k in ('S', 'K', 'T', 'r', 'sigma'))
+    return (log(S/K) + (r + sigma**2/2)*T)/(sigma*sqrt(T))
+
+
+def _bt_error_scale(params):
+    S, T, sigma = params['S'], params['T'], params['sigma']
+    return S * sigma * sqrt(T) * max(float(norm.pdf(_d1(params))), PDF_FLOOR)
+
+
+def _payoff_std(params, option_type):
+    # Closed-form standard deviation of the discounted terminal payoff.
+    S, K, T, r, sigma = (params[k] for k in ('S', 'K', 'T', 'r', 'sigma'))
+    d1 = _d1(params)
+    d2 = d1 - sigma*sqrt(T)
+    d0 = d1 + sigma*sqrt(T)
+    forward = S*exp(r*T)
+    second = forward**2 * exp(sigma**2*T)
+    if option_type == 1:
+        mean = forward*norm.cdf(d1) - K*norm.cdf(d2)
+        second_moment = second*norm.cdf(d0) - 2*K*forward*norm.cdf(d1) + K**2*norm.cdf(d2)
+    else:
+        mean = K*norm.cdf(-d2) - forward*norm.cdf(-d1)
+        second_moment = K**2*norm.cdf(-d2) - 2*K*forward*norm.cdf(-d1) + second*norm.cdf(-d0)
+    return exp(-r*T) * sqrt(max(float(second_moment - mean**2), 0.0))
+
+
+def _best_time(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    import sys
+
+    model = CostModel()
+    print(json.dumps(model.calibrate(), indent=2))
+    if len(sys.argv) > 1:
+        model.save(sys.argv[1])
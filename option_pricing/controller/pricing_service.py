@@ -1,7 +1,18 @@
-from core import bs_greeks, bt_price, mc_price
+import time
+from typing import Any, Iterator
+import numpy as np
+from ..core import (bs_greeks, bs_greeks_batch, bs_price, bt_greeks_batch, bt_price, bt_price_progressive,
+                    mc_greeks_batch, mc_price, mc_price_progressive)
+from .engine_selector import CostModel
+
+# Contract parameters a sweep can vary.
+SWEEP_PARAMS = ('S', 'K', 'T', 'r', 'sigma')
 
 class PricingService:
     """Service for pricing options using various models."""
+
+    # Shared by calculate_auto; refined with every timing it records.
+    cost_model = CostModel()
     
     @staticmethod
     def calculate_bs(params: dict[str, float]) -> dict[str, float] | None:
@@ -55,4 +66,143 @@ class PricingService:
             mc_put = mc_price(params['S'], params['K'], params['T'], params['r'], params['sigma'], num_sim, 0)
             return {'call': round(mc_call,4), 'put': round(mc_put,4)}
         except Exception:
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def calculate_bt_progressive(params: dict[str, float], time_steps: int, style: str,
+                                 cancel=None) -> Iterator[dict[str, float]]:
+        """Yield Binomial Tree prices at increasing step counts up to time_steps.
+        
+        Earlier prices are extrapolated; the last one is the plain
+        time_steps tree, as calculate_bt returns.
+        
+        Args:
+            params: dict with keys S, K, T, r, sigma
+            time_steps: int
+            style: 'american' or 'european'
+            cancel: optional threading.Event; setting it ends the generator
+        
+        Yields:
+            dict: {'call': float, 'put': float, 'call_error': float,
+                   'put_error': float, 'resolution': int}
+        """
+        args = (params['S'], params['K'], params['T'], params['r'], params['sigma'], time_steps)
+        calls = bt_price_progressive(*args, 1, style=style, cancel=cancel)
+        puts = bt_price_progressive(*args, 0, style=style, cancel=cancel)
+        for call, put in zip(calls, puts):
+            yield {'call': round(call.price,4), 'put': round(put.price,4),
+                   'call_error': call.error, 'put_error': put.error, 'resolution': call.resolution}
+
+    @staticmethod
+    def calculate_mc_progressive(params: dict[str, float], num_sim: int,
+                                 cancel=None) -> Iterator[dict[str, float]]:
+        """Yield Monte Carlo prices with 95% confidence half-widths as paths accumulate.
+        
+        Args:
+            params: dict with keys S, K, T, r, sigma
+            num_sim: int
+            cancel: optional threading.Event; setting it ends the generator
+        
+        Yields:
+            dict: {'call': float, 'put': float, 'call_error': float,
+                   'put_error': float, 'resolution': int}
+        """
+        args = (params['S'], params['K'], params['T'], params['r'], params['sigma'], num_sim)
+        calls = mc_price_progressive(*args, 1, cancel=cancel)
+        puts = mc_price_progressive(*args, 0, cancel=cancel)
+        for call, put in zip(calls, puts):
+            yield {'call': round(call.price,4), 'put': round(put.price,4),
+                   'call_error': call.error, 'put_error': put.error, 'resolution': call.resolution}
+
+    @staticmethod
+    def calculate_auto(params: dict[str, float], target_error: float, time_budget: float, option_type: int = 1,
+                       style: str = 'european', engines: tuple[str, ...] | None = None) -> dict[str, Any] | None:
+        """Price with the cheapest engine and resolution predicted to meet an error target.
+        
+        Uses PricingService.cost_model to choose among Black-Scholes, Binomial
+        Tree and Monte Carlo (European) or Binomial Tree (American), then
+        records the actual run time to refine the model. If the target cannot
+        be met within time_budget, the most accurate configuration that fits
+        is used and met_target is False. The price is not rounded.
+        
+        Args:
+            params: dict with keys S, K, T, r, sigma
+            target_error: float absolute price error (95% half-width for Monte Carlo)
+            time_budget: float seconds
+            option_type: 1 for call, 0 for put
+            style: 'american' or 'european'
+            engines: optional subset of ('bs', 'bt', 'mc') to choose from
+        
+        Returns:
+            dict: {'price', 'engine', 'resolution', 'estimated_error',
+                   'estimated_time', 'elapsed', 'met_target'} or None if error
+        """
+        try:
+            model = PricingService.cost_model
+            choice = model.choose(params, option_type, style, target_error, time_budget, engines)
+            args = (params['S'], params['K'], params['T'], params['r'], params['sigma'])
+
+            start = time.perf_counter()
+            if choice.engine == 'bs':
+                price = bs_price(*args, option_type)
+            elif choice.engine == 'bt':
+                price = bt_price(*args, choice.resolution, option_type, style=style)
+            else:
+                price = mc_price(*args, choice.resolution, option_type)
+            elapsed = time.perf_counter() - start
+            model.record(choice.engine, style, choice.resolution, elapsed)
+
+            return {'price': price, 'engine': choice.engine, 'resolution': choice.resolution,
+                    'estimated_error': choice.estimated_error, 'estimated_time': choice.estimated_time,
+                    'elapsed': elapsed, 'met_target': choice.estimated_error <= target_error}
+        except Exception:
+            return None
+
+    @staticmethod
+    def calculate_sweep(params: dict[str, float], vary: dict[str, Any], engine: str = 'bs', option_type: int = 1,
+                        style: str = 'european', time_steps: int = 100,
+                        num_sim: int = 100000) -> dict[str, Any] | None:
+        """Calculate price and Greek surfaces over a grid of one or two parameters.
+        
+        The whole grid is priced in one batched call to the engine. The
+        Binomial Tree shares its lattices across grid points when only S and
+        K vary. Monte Carlo prices every point on the same simulated paths,
+        so the surfaces are smooth. Greeks follow bs_greeks: Vega and Rho per
+        unit change, Theta per year.
+        
+        Args:
+            params: dict with keys S, K, T, r, sigma (the base contract)
+            vary: dict mapping one or two of S, K, T, r, sigma to 1-D grids of
+                values, e.g. {'S': np.linspace(80, 120, 101)}
+            engine: 'bs', 'bt' or 'mc'
+            option_type: 1 for call, 0 for put
+            style: 'american' or 'european' (Binomial Tree only)
+            time_steps: int Binomial Tree steps
+            num_sim: int Monte Carlo paths
+        
+        Returns:
+            dict: {'axes': {name: np.ndarray}, 'Price', 'Delta', 'Gamma', 'Vega',
+                   'Theta', 'Rho'}, each surface an np.ndarray of shape
+                   (len(grid),) or (len(grid1), len(grid2)) in the order of
+                   vary, or None if error
+        """
+        try:
+            if not 1 <= len(vary) <= 2 or any(name not in SWEEP_PARAMS for name in vary):
+                raise ValueError(f"vary must map one or two of {SWEEP_PARAMS} to grids.")
+            if engine != 'bt' and style != 'european':
+                raise ValueError(f"Engine {engine!r} prices European options only.")
+            axes = {name: np.asarray(values, dtype=np.float64).ravel() for name, values in vary.items()}
+            grids = dict(zip(axes, np.meshgrid(*axes.values(), indexing='ij')))
+            args = [grids.get(name, params[name]) for name in SWEEP_PARAMS]
+
+            if engine == 'bs':
+                surfaces = bs_greeks_batch(*args, option_type)
+            elif engine == 'bt':
+                surfaces = bt_greeks_batch(*args, time_steps, option_type, style=style)
+            elif engine == 'mc':
+                surfaces = mc_greeks_batch(*args, num_sim, option_type)
+            else:
+                raise ValueError(f"Unknown engine: {engine!r}.")
+            return {'axes': axes, **surfaces}
+        except Exception:
+            return None
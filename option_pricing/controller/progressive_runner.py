@@ -0,0 +1,129 @@
+import threading
+from typing import Iterator
+
+from PySide6.QtCore import QObject, Signal
+
+from ..core import mc_price_progressive
+
+
+class ProgressiveRunner(QObject):
+    """Streams progressive pricing results into table columns.
+
+    Each column steps its generator from PricingService.calculate_*_progressive
+    on its own background thread, so a slow Binomial Tree level never holds
+    back Monte Carlo updates, and delivers every result to the GUI thread
+    through the `updated` signal. Starting a column replaces whatever was
+    running there and sets the old job's cancel event, which the generators
+    check between kernel chunks; the fresh job starts within milliseconds
+    instead of waiting for a stale level to finish. A column that is stopped
+    keeps its last result on screen.
+    """
+
+    # column, generation, result dict; generation lets stale results be dropped
+    updated = Signal(int, int, dict)
+    failed = Signal(int, int)
+
+    def __init__(self, table_manager, parent=None):
+        super().__init__(parent)
+        self.table_manager = table_manager
+        self._jobs: dict[int, tuple[int, Iterator[dict], threading.Event | None]] = {}
+        self._generations: dict[int, int] = {}
+        self._threads: dict[int, threading.Thread] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self.updated.connect(self._on_updated)
+        self.failed.connect(self._on_failed)
+        # numba's TBB threading layer can hang at interpreter exit when its
+        # first parallel launch happens off the main thread, so launch (and
+        # compile) the parallel Monte Carlo kernel here once.
+        for _ in mc_price_progressive(1.0, 1.0, 1.0, 0.0, 1.0, 2):
+            pass
+
+    def start(self, col: int, results: Iterator[dict], cancel: threading.Event | None = None) -> None:
+        """Stream a generator of {'call', 'put', 'call_error', 'put_error'} dicts into a column.
+
+        Args:
+            col: int column index
+            results: generator of result dicts
+            cancel: the event the generator checks for cancellation; set
+                when the column is restarted, stopped or closed
+        """
+        with self._condition:
+            self._cancel(col)
+            generation = self._generations.get(col, 0) + 1
+            self._generations[col] = generation
+            self._jobs[col] = (generation, results, cancel)
+            if col not in self._threads:
+                thread = threading.Thread(target=self._run, args=(col,), name=f"progressive-pricing-{col}",
+                                          daemon=True)
+                self._threads[col] = thread
+                thread.start()
+            self._condition.notify_all()
+
+    def stop(self, col: int | None = None) -> None:
+        """Stop refining one column, or every column if col is None."""
+        with self._condition:
+            for c in ([col] if col is not None else list(self._jobs)):
+                self._cancel(c)
+                self._jobs.pop(c, None)
+                self._generations[c] = self._generations.get(c, 0) + 1
+
+    def is_running(self, col: int | None = None) -> bool:
+        with self._condition:
+            return bool(self._jobs) if col is None else col in self._jobs
+
+    def close(self, wait: bool = True) -> None:
+        """Stop all columns and end the background threads.
+
+        Args:
+            wait: block until the kernel chunks currently running (if any) return
+        """
+        with self._condition:
+            self._closed = True
+            for col in list(self._jobs):
+                self._cancel(col)
+            self._jobs.clear()
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads.values():
+                thread.join()
+
+    def _cancel(self, col):
+        # Caller holds the condition.
+        if col in self._jobs and self._jobs[col][2] is not None:
+            self._jobs[col][2].set()
+
+    def _run(self, col: int) -> None:
+        while True:
+            with self._condition:
+                while col not in self._jobs and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                generation, results, _ = self._jobs[col]
+
+            try:
+                result = next(results)
+            except StopIteration:
+                self._finish(col, generation)
+                continue
+            except Exception:
+                self._finish(col, generation)
+                self.failed.emit(col, generation)
+                continue
+            self.updated.emit(col, generation, result)
+
+    def _finish(self, col, generation):
+        with self._condition:
+            if col in self._jobs and self._jobs[col][0] == generation:
+                del self._jobs[col]
+
+    def _on_updated(self, col, generation, result):
+        if generation != self._generations.get(col):
+            return
+        self.table_manager.update_column(col, result['call'], result['put'],
+                                         result['call_error'], result['put_error'])
+
+    def _on_failed(self, col, generation):
+        if generation == self._generations.get(col):
+            self.table_manager.clear_column(col)
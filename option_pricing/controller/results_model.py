@@ -0,0 +1,190 @@
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# Above this many separate changed row runs, one bounding dataChanged is
+# cheaper for the view than many small ones.
+MAX_CHANGED_RANGES = 64
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Read-only table model over a 2-D NumPy array of results.
+
+    Cells are formatted only when a view asks for them, so the cost of a
+    repaint depends on the visible cells, not the table size. NaN cells are
+    shown empty. An optional errors array of the same shape adds an error
+    bar ("price ± error") to cells where it is not NaN. Sorting and
+    filtering act on an index array of visible
+    source rows; the values array itself is never copied or reordered.
+    """
+
+    def __init__(self, values, row_labels=None, column_labels=None, decimals=4, errors=None, parent=None):
+        """Initialize the model.
+
+        Args:
+            values: 2-D array-like of floats, shape (rows, columns)
+            row_labels: sequence of vertical header labels, or None for row numbers
+            column_labels: sequence of horizontal header labels, or None for column numbers
+            decimals: digits shown after the decimal point
+            errors: array-like of error bars with the shape of values, or None
+        """
+        super().__init__(parent)
+        self._values = self._as_values(values)
+        self._errors = self._as_errors(errors, self._values.shape)
+        self.row_labels = row_labels
+        self.column_labels = column_labels
+        self.decimals = decimals
+        self._filter_mask = None
+        self._sort_column = None
+        self._sort_order = Qt.AscendingOrder
+        self._rows = np.arange(self._values.shape[0])
+
+    @staticmethod
+    def _as_values(values):
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2:
+            raise ValueError("values must be a 2-D array.")
+        return values
+
+    @staticmethod
+    def _as_errors(errors, shape):
+        if errors is None:
+            return np.full(shape, np.nan)
+        return np.broadcast_to(np.asarray(errors, dtype=np.float64), shape)
+
+    @property
+    def values(self):
+        """The backing array (source row order)."""
+        return self._values
+
+    @property
+    def errors(self):
+        """The error bar array (source row order); NaN where there is none."""
+        return self._errors
+
+    def source_row(self, row):
+        """Map a view row to its row in the backing array."""
+        return int(self._rows[row])
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._values.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            row = self._rows[index.row()]
+            value = self._values[row, index.column()]
+            if np.isnan(value):
+                return ""
+            error = self._errors[row, index.column()]
+            if np.isnan(error):
+                return f"{value:.{self.decimals}f}"
+            return f"{value:.{self.decimals}f} ± {error:.{self.decimals}f}"
+        if role == Qt.UserRole:
+            return float(self._values[self._rows[index.row()], index.column()])
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self.column_labels[section]) if self.column_labels is not None else str(section + 1)
+        source = self._rows[section]
+        return str(self.row_labels[source]) if self.row_labels is not None else str(source + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Order view rows by a column; NaN cells sort last in either direction."""
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self._rows = self._visible_rows()
+        self.layoutChanged.emit()
+
+    # Updates
+
+    def set_filter(self, mask):
+        """Show only source rows where mask is True; None shows every row.
+
+        Args:
+            mask: boolean array-like of length rows, or None
+        """
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (self._values.shape[0],):
+                raise ValueError("mask must have one entry per row.")
+        self.beginResetModel()
+        self._filter_mask = mask
+        self._rows = self._visible_rows()
+        self.endResetModel()
+
+    def set_values(self, values, errors=None):
+        """Replace the backing arrays, signalling only the cells that changed.
+
+        Pass new arrays rather than mutating the current ones in place, since
+        the previous values are needed to find what changed. A shape change
+        resets the model.
+        """
+        values = self._as_values(values)
+        errors = self._as_errors(errors, values.shape)
+        if values.shape != self._values.shape:
+            self.beginResetModel()
+            self._values = values
+            self._errors = errors
+            self._filter_mask = None
+            self._rows = self._visible_rows()
+            self.endResetModel()
+            return
+
+        changed = _changed(self._values, values) | _changed(self._errors, errors)
+        self._values = values
+        self._errors = errors
+        if not changed.any():
+            return
+        if self._sort_column is not None and changed[:, self._sort_column].any():
+            self.sort(self._sort_column, self._sort_order)
+        self._emit_changed(changed[self._rows])
+
+    def set_column(self, column, column_values, column_errors=np.nan):
+        """Replace one column's values and error bars and signal the rows that changed."""
+        values = self._values.copy()
+        values[:, column] = column_values
+        errors = np.array(self._errors)
+        errors[:, column] = column_errors
+        self.set_values(values, errors)
+
+    def _visible_rows(self):
+        rows = np.arange(self._values.shape[0])
+        if self._filter_mask is not None:
+            rows = rows[self._filter_mask]
+        if self._sort_column is not None:
+            keys = self._values[rows, self._sort_column]
+            if self._sort_order == Qt.DescendingOrder:
+                keys = -keys
+            # NaN keys sort last; stable so ties keep source order.
+            rows = rows[np.argsort(keys, kind='stable')]
+        return rows
+
+    def _emit_changed(self, changed):
+        # One dataChanged per run of consecutive changed view rows, spanning
+        # only the columns that changed within that run.
+        changed_rows = np.flatnonzero(changed.any(axis=1))
+        if changed_rows.size == 0:
+            return
+        breaks = np.flatnonzero(np.diff(changed_rows) > 1) + 1
+        runs = np.split(changed_rows, breaks) if len(breaks) < MAX_CHANGED_RANGES else [changed_rows]
+        for run in runs:
+            columns = np.flatnonzero(changed[run].any(axis=0))
+            top_left = self.index(int(run[0]), int(columns[0]))
+            bottom_right = self.index(int(run[-1]), int(columns[-1]))
+            self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.UserRole])
+
+
+def _changed(old, new):
+    return ~((old == new) | (np.isnan(old) & np.isnan(new)))
@@ -0,0 +1,134 @@
+import numpy as np
+from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QVBoxLayout
+
+from .pricing_service import PricingService
+
+# Parameters the chart can vary, with their labels and the plotted range as
+# multiples of the current input.
+CHART_PARAMETERS = {
+    'S': ("Stock Price (S)", 0.5, 1.5),
+    'K': ("Strike (K)", 0.5, 1.5),
+    'T': ("Time (T)", 0.02, 2.0),
+    'sigma': ("Volatility (σ)", 0.05, 2.0),
+}
+CHART_QUANTITIES = ('Price', 'Delta', 'Gamma', 'Vega', 'Theta', 'Rho')
+CHART_POINTS = 101
+
+# American curves come from the Binomial Tree; a fixed, modest step count
+# keeps a redraw within a frame whatever the table's step input is.
+CHART_STEPS = 100
+
+
+class SweepChart:
+    """Plots call and put price or Greek curves against one contract parameter.
+
+    Each redraw prices the whole curve with one PricingService.calculate_sweep
+    call per option type (Black-Scholes for European, Binomial Tree for
+    American options) and swaps the points into the existing series.
+    Binomial curves skip the points where the CHART_STEPS lattice is invalid.
+    """
+
+    def __init__(self, container, parameter_box, quantity_box):
+        """Build the chart inside container and wire up the selector combo boxes."""
+        self.parameter_box = parameter_box
+        self.quantity_box = quantity_box
+        self._params = None
+        self._style = 'european'
+
+        self.chart = QChart()
+        self.chart.legend().setAlignment(Qt.AlignBottom)
+        self.x_axis = QValueAxis()
+        self.y_axis = QValueAxis()
+        self.chart.addAxis(self.x_axis, Qt.AlignBottom)
+        self.chart.addAxis(self.y_axis, Qt.AlignLeft)
+        self.series = {}
+        for option_type, name in ((1, "Call"), (0, "Put")):
+            series = QLineSeries()
+            series.setName(name)
+            self.chart.addSeries(series)
+            series.attachAxis(self.x_axis)
+            series.attachAxis(self.y_axis)
+            self.series[option_type] = series
+
+        self.view = QChartView(self.chart)
+        self.view.setRenderHint(QPainter.Antialiasing)
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.view)
+
+        for name, (label, _, _) in CHART_PARAMETERS.items():
+            parameter_box.addItem(label, name)
+        quantity_box.addItems(CHART_QUANTITIES)
+        parameter_box.currentIndexChanged.connect(self.refresh)
+        quantity_box.currentIndexChanged.connect(self.refresh)
+
+        # Compile the sweep kernels up front so the first redraw is not slow.
+        base = {'S': 1.0, 'K': 1.0, 'T': 1.0, 'r': 0.0, 'sigma': 1.0}
+        PricingService.calculate_sweep(base, {'S': [1.0]}, 'bs')
+        PricingService.calculate_sweep(base, {'S': [1.0]}, 'bt', style='american', time_steps=2)
+        PricingService.calculate_sweep(base, {'T': [1.0]}, 'bt', style='american', time_steps=2)
+
+    def update(self, params, style):
+        """Redraw for new contract inputs.
+
+        Args:
+            params: dict with keys S, K, T, r, sigma
+            style: 'american' or 'european'
+        """
+        self._params = params
+        self._style = style
+        self.refresh()
+
+    def clear(self):
+        """Remove the curves until the next update."""
+        self._params = None
+        self._clear_series()
+
+    def _clear_series(self):
+        for series in self.series.values():
+            series.clear()
+
+    def refresh(self):
+        """Redraw the current inputs for the selected parameter and quantity."""
+        if self._params is None:
+            return
+        name = self.parameter_box.currentData()
+        quantity = self.quantity_box.currentText()
+        _, low, high = CHART_PARAMETERS[name]
+        grid = np.linspace(low, high, CHART_POINTS) * self._params[name]
+        engine = 'bs' if self._style == 'european' else 'bt'
+        if engine == 'bt':
+            # The CRR up-move probability leaves [0, 1] once |r|*dt reaches
+            # sigma*sqrt(dt), and the lattice Greeks are meaningless there.
+            point = {key: (grid if key == name else self._params[key]) for key in ('T', 'r', 'sigma')}
+            dt = point['T'] / CHART_STEPS
+            valid = point['sigma'] * np.sqrt(dt) > np.abs(point['r']) * dt
+            grid = grid[np.broadcast_to(valid, grid.shape)]
+            if grid.size == 0:
+                self._clear_series()
+                return
+
+        curves = {}
+        for option_type in self.series:
+            result = PricingService.calculate_sweep(self._params, {name: grid}, engine, option_type,
+                                                    self._style, CHART_STEPS)
+            if result is None:
+                # Keep the inputs, so changing the selectors can still redraw.
+                self._clear_series()
+                return
+            curves[option_type] = result[quantity]
+
+        for option_type, values in curves.items():
+            self.series[option_type].replace([QPointF(x, y) for x, y in zip(grid, values) if np.isfinite(y)])
+        self.x_axis.setTitleText(CHART_PARAMETERS[name][0])
+        self.x_axis.setRange(grid[0], grid[-1])
+        values = np.concatenate(list(curves.values()))
+        values = values[np.isfinite(values)]
+        if values.size:
+            low, high = float(values.min()), float(values.max())
+            margin = 0.05 * (high - low) or max(abs(high), 1.0) * 0.05
+            self.y_axis.setRange(low - margin, high + margin)
+        self.y_axis.setTitleText(quantity)
@@ -1,5 +1,11 @@
-from .black_scholes import bs_greeks, bs_price
-from .binomial_tree import bt_price
-from .monte_carlo import mc_price
+from .black_scholes import bs_greeks, bs_greeks_batch, bs_price, bs_price_batch
+from .binomial_tree import bt_greeks_batch, bt_price, bt_price_batch
+from .monte_carlo import mc_greeks_batch, mc_price, mc_price_batch
+from .monte_carlo_sharded import McStatistics, mc_price_sharded, mc_shard
+from .progressive import Estimate, bt_price_progressive, mc_price_progressive
 
-__all__ = ['bs_greeks', 'bs_price', 'bt_price', 'mc_price']
\ No newline at end of file
+__all__ = ['bs_greeks', 'bs_greeks_batch', 'bs_price', 'bs_price_batch',
+           'bt_greeks_batch', 'bt_price', 'bt_price_batch',
+           'mc_greeks_batch', 'mc_price', 'mc_price_batch',
+           'McStatistics', 'mc_price_sharded', 'mc_shard',
+           'Estimate', 'bt_price_progressive', 'mc_price_progressive']
@@ -0,0 +1,36 @@
+import numpy as np
+
+PRECISIONS = {'float64': np.float64, 'float32': np.float32}
+
+
+def resolve_precision(precision):
+    """Map a precision name ('float64' or 'float32') to its NumPy type.
+
+    Raises:
+        ValueError: If precision is not a supported name.
+    """
+    try:
+        return PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(f"precision must be one of {sorted(PRECISIONS)}, got {precision!r}.") from None
+
+
+def broadcast_contracts(float_args, int_args=()):
+    """Broadcast per-contract inputs to a common shape.
+
+    Args:
+        float_args: sequence of scalars/array-likes (S, K, T, r, sigma, ...)
+        int_args: sequence of scalars/array-likes (steps, option_type, ...)
+
+    Returns:
+        tuple: (shape, flat float64 arrays, flat int64 arrays)
+    """
+    arrays = [np.asarray(a) for a in (*float_args, *int_args)]
+    shape = np.broadcast_shapes(*(a.shape for a in arrays))
+    # Only expand inputs that need it; arrays already of the full shape are
+    # passed through, so no read-only broadcast views reach the kernels.
+    arrays = [a if a.shape == shape else np.broadcast_to(a, shape).copy() for a in arrays]
+    n_float = len(float_args)
+    floats = [np.ascontiguousarray(a, dtype=np.float64).ravel() for a in arrays[:n_float]]
+    ints = [np.ascontiguousarray(a, dtype=np.int64).ravel() for a in arrays[n_float:]]
+    return shape, floats, ints
@@ -1,11 +1,12 @@
 import numpy as np
 from math import log, sqrt, exp
-from numba import njit
+from numba import njit, prange
+from ._vectorize import broadcast_contracts
 
 @njit(fastmath=True)
-def bt_price(S, K, T, r, sigma, steps=100, option_type=1, style='european'):
+def _bt_kernel(S, K, T, r, sigma, steps, option_type, is_american):
     # option_type_int: 1=Call, -1=Put
-    
+
     dt = T / steps
     u = exp(sigma * sqrt(dt))
     d = 1 / u
@@ -16,7 +17,7 @@ def bt_price(S, K, T, r, sigma, steps=100, option_type=1, style='european'):
     asset_prices = np.empty(steps + 1)
     for j in range(steps + 1):
         asset_prices[j] = S * (u ** j) * (d ** (steps - j))
-   
+
     # Initialize option values at maturity
     option_values = np.empty(steps + 1)
     if option_type == 1:
@@ -27,13 +28,11 @@ def bt_price(S, K, T, r, sigma, steps=100, option_type=1, style='european'):
             option_values[j] = max(0.0, K - asset_prices[j])
 
     # Backward induction
-    is_american = (style == 'american')
-    
     for i in range(steps - 1, -1, -1):
         for j in range(i + 1):
             # Calculate discounted expected value
             option_values[j] = discount * (p * option_values[j + 1] + (1 - p) * option_values[j])
-            
+
             # Check early exercise for American options
             if is_american:
                 asset_price = S * (u ** j) * (d ** (i - j))
@@ -42,5 +41,161 @@ def bt_price(S, K, T, r, sigma, steps=100, option_type=1, style='european'):
                 else:
                     exercise_value = max(0.0, K - asset_price)
                 option_values[j] = max(option_values[j], exercise_value)
-    
-    return float(option_values[0])
+
+    return option_values[0]
+
+@njit(fastmath=True)
+def bt_price(S, K, T, r, sigma, steps=100, option_type=1, style='european'):
+    # option_type_int: 1=Call, -1=Put
+    return float(_bt_kernel(S, K, T, r, sigma, steps, option_type, style == 'american'))
+
+@njit(parallel=True, fastmath=True)
+def _bt_price_batch(S, K, T, r, sigma, steps, option_type, is_american):
+    out = np.empty(S.shape[0])
+    for i in prange(S.shape[0]):
+        out[i] = _bt_kernel(S[i], K[i], T[i], r[i], sigma[i], steps[i], option_type[i], is_american)
+    return out
+
+def bt_price_batch(S, K, T, r, sigma, steps=100, option_type=1, style='european'):
+    """Vectorized bt_price over arrays of contracts.
+
+    All arguments except style broadcast against each other; contracts are
+    priced in parallel, one lattice per contract.
+
+    Returns:
+        np.ndarray: prices with the broadcast shape of the inputs
+
+    Raises:
+        ValueError: If any steps is below 1.
+    """
+    shape, (S, K, T, r, sigma), (steps, option_type) = broadcast_contracts((S, K, T, r, sigma), (steps, option_type))
+    if np.any(steps < 1):
+        raise ValueError("steps must be at least 1.")
+    out = _bt_price_batch(S, K, T, r, sigma, steps, option_type, style == 'american')
+    return out.reshape(shape)
+
+# Bump sizes for the binomial Vega and Rho (central differences).
+VEGA_BUMP = 0.01
+RHO_BUMP = 0.0001
+
+@njit(fastmath=True)
+def _bt_lattice(T, r, sigma, steps):
+    # Node (i, j) of the lattice sits at S * powers[2*j - i + steps], so one
+    # set of powers of u serves every spot and strike priced on it.
+    dt = T / steps
+    u = exp(sigma * sqrt(dt))
+    p = (exp(r * dt) - 1 / u) / (u - 1 / u)
+    discount = exp(-r * dt)
+    powers = np.empty(2 * steps + 1)
+    for k in range(2 * steps + 1):
+        powers[k] = u ** (k - steps)
+    return powers, p, discount, dt
+
+@njit(fastmath=True)
+def _bt_induction(S, K, powers, p, discount, steps, option_type, is_american, nodes):
+    # Backward induction on a prebuilt lattice. Returns the price and leaves
+    # the values of the first two time steps in nodes: [f10, f11, f20, f21, f22].
+    values = np.empty(steps + 1)
+    for j in range(steps + 1):
+        if option_type == 1:
+            values[j] = max(0.0, S * powers[2 * j] - K)
+        else:
+            values[j] = max(0.0, K - S * powers[2 * j])
+    if steps == 2:
+        nodes[2:5] = values[:3]
+
+    for i in range(steps - 1, -1, -1):
+        for j in range(i + 1):
+            values[j] = discount * (p * values[j + 1] + (1 - p) * values[j])
+            if is_american:
+                asset_price = S * powers[2 * j - i + steps]
+                if option_type == 1:
+                    values[j] = max(values[j], asset_price - K)
+                else:
+                    values[j] = max(values[j], K - asset_price)
+        if i == 2:
+            nodes[2:5] = values[:3]
+        elif i == 1:
+            nodes[0:2] = values[:2]
+    return values[0]
+
+@njit(fastmath=True)
+def _bt_lattice_greeks(S, K, lattice, sigma_up, sigma_down, r_up, r_down, sigma_bump, r_bump,
+                       steps, option_type, is_american, out):
+    # Price, Delta, Gamma and Theta come from the first nodes of the base
+    # lattice; Vega and Rho from central differences over bumped lattices.
+    # out: [Delta, Gamma, Vega, Theta, Rho, Price]
+    powers, p, discount, dt = lattice
+    nodes = np.empty(5)
+    price = _bt_induction(S, K, powers, p, discount, steps, option_type, is_american, nodes)
+    u, d = powers[steps + 1], powers[steps - 1]
+    uu, dd = powers[steps + 2], powers[steps - 2]
+    out[0] = (nodes[1] - nodes[0]) / (S * (u - d))
+    out[1] = ((nodes[4] - nodes[3]) / (S * (uu - 1)) - (nodes[3] - nodes[2]) / (S * (1 - dd))) / (0.5 * S * (uu - dd))
+    out[3] = (nodes[3] - price) / (2 * dt)
+    out[5] = price
+
+    up = _bt_induction(S, K, sigma_up[0], sigma_up[1], sigma_up[2], steps, option_type, is_american, nodes)
+    down = _bt_induction(S, K, sigma_down[0], sigma_down[1], sigma_down[2], steps, option_type, is_american, nodes)
+    out[2] = (up - down) / (2 * sigma_bump)
+    up = _bt_induction(S, K, r_up[0], r_up[1], r_up[2], steps, option_type, is_american, nodes)
+    down = _bt_induction(S, K, r_down[0], r_down[1], r_down[2], steps, option_type, is_american, nodes)
+    out[4] = (up - down) / (2 * r_bump)
+
+@njit(parallel=True, fastmath=True)
+def _bt_greeks_batch(S, K, T, r, sigma, steps, option_type, is_american):
+    out = np.empty((6, S.shape[0]))
+    for i in prange(S.shape[0]):
+        sigma_bump = min(VEGA_BUMP, 0.5 * sigma[i])
+        _bt_lattice_greeks(S[i], K[i], _bt_lattice(T[i], r[i], sigma[i], steps[i]),
+                           _bt_lattice(T[i], r[i], sigma[i] + sigma_bump, steps[i]),
+                           _bt_lattice(T[i], r[i], sigma[i] - sigma_bump, steps[i]),
+                           _bt_lattice(T[i], r[i] + RHO_BUMP, sigma[i], steps[i]),
+                           _bt_lattice(T[i], r[i] - RHO_BUMP, sigma[i], steps[i]),
+                           sigma_bump, RHO_BUMP, steps[i], option_type[i], is_american, out[:, i])
+    return out
+
+@njit(parallel=True, fastmath=True)
+def _bt_greeks_batch_shared(S, K, T, r, sigma, steps, option_type, is_american):
+    # T, r, sigma and steps are common to every contract: the five lattices
+    # are built once and only the spot and strike vary.
+    sigma_bump = min(VEGA_BUMP, 0.5 * sigma)
+    lattice = _bt_lattice(T, r, sigma, steps)
+    sigma_up = _bt_lattice(T, r, sigma + sigma_bump, steps)
+    sigma_down = _bt_lattice(T, r, sigma - sigma_bump, steps)
+    r_up = _bt_lattice(T, r + RHO_BUMP, sigma, steps)
+    r_down = _bt_lattice(T, r - RHO_BUMP, sigma, steps)
+    out = np.empty((6, S.shape[0]))
+    for i in prange(S.shape[0]):
+        _bt_lattice_greeks(S[i], K[i], lattice, sigma_up, sigma_down, r_up, r_down,
+                           sigma_bump, RHO_BUMP, steps, option_type[i], is_american, out[:, i])
+    return out
+
+def bt_greeks_batch(S, K, T, r, sigma, steps=100, option_type=1, style='european'):
+    """Binomial prices and Greeks over arrays of contracts.
+
+    All arguments except style broadcast against each other. Delta, Gamma
+    and Theta are read off the first two time steps of each contract's
+    lattice; Vega and Rho are central differences over lattices with sigma
+    bumped by VEGA_BUMP and r by RHO_BUMP. When T, r, sigma and steps are
+    scalars (a sweep over spot and/or strike) the lattices are built once
+    and shared by every contract.
+
+    Returns:
+        dict: same keys as bs_greeks, each mapped to an np.ndarray with the
+        broadcast shape of the inputs
+
+    Raises:
+        ValueError: If steps is below 2.
+    """
+    if np.any(np.asarray(steps) < 2):
+        raise ValueError("steps must be at least 2 for binomial Greeks.")
+    is_american = style == 'american'
+    shared = all(np.ndim(a) == 0 for a in (T, r, sigma, steps))
+    shape, (S, K, T, r, sigma), (steps, option_type) = broadcast_contracts((S, K, T, r, sigma), (steps, option_type))
+    if shared and S.size:
+        out = _bt_greeks_batch_shared(S, K, T[0], r[0], sigma[0], steps[0], option_type, is_american)
+    else:
+        out = _bt_greeks_batch(S, K, T, r, sigma, steps, option_type, is_american)
+    names = ("Delta", "Gamma", "Vega", "Theta", "Rho", "Price")
+    return {name: values.reshape(shape) for name, values in zip(names, out)}
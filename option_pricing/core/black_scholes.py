@@ -1,6 +1,8 @@
 import numpy as np
 from math import log, sqrt, exp
 from scipy.stats import norm
+from scipy.special import ndtr
+from ._vectorize import broadcast_contracts
 
 def bs_price(S, K, T, r, sigma, option_type=1):
     # option_type_int: 1=Call, -1=Put
@@ -44,7 +46,7 @@ def bs_greeks(S, K, T, r, sigma, option_type=1):
         rho = K*T*exp(-r*T)*Nd2
     else:
         delta = -Nd1_
-        theta = -S*nd1*sigma/(2*sqrt(T)) - r*K*exp(-r*T)*Nd2_
+        theta = -S*nd1*sigma/(2*sqrt(T)) + r*K*exp(-r*T)*Nd2_
         rho = -K*T*exp(-r*T)*Nd2_
     
     gamma = nd1/(S*sigma*sqrt(T))
@@ -53,4 +55,73 @@ def bs_greeks(S, K, T, r, sigma, option_type=1):
     results.update({"Delta":float(delta), "Gamma":float(gamma), "Vega":float(vega), "Theta":float(theta), "Rho":float(rho)},)
     results['Price'] = bs_price(S, K, T, r, sigma, option_type)
 
-    return results
\ No newline at end of file
+    return results
+
+
+def _npdf(x):
+    return np.exp(-x*x/2) / sqrt(2*np.pi)
+
+
+def _bs_d1_d2(S, K, T, r, sigma):
+    # Degenerate contracts get placeholder T/sigma so the formula stays finite;
+    # callers overwrite their results with the intrinsic value.
+    degenerate = (T <= 0) | (sigma <= 0)
+    T_ = np.where(degenerate, 1.0, T)
+    sigma_ = np.where(degenerate, 1.0, sigma)
+    sqrt_T = np.sqrt(T_)
+    d1 = (np.log(S/K) + (r + sigma_**2/2)*T_)/(sigma_*sqrt_T)
+    d2 = d1 - sigma_*sqrt_T
+    return d1, d2, sqrt_T, degenerate
+
+
+def _bs_price_flat(S, K, T, r, sigma, is_call):
+    disc_K = K*np.exp(-r*T)
+    d1, d2, _, degenerate = _bs_d1_d2(S, K, T, r, sigma)
+    call = S*ndtr(d1) - disc_K*ndtr(d2)
+    put = disc_K*ndtr(-d2) - S*ndtr(-d1)
+    price = np.where(is_call, call, put)
+
+    intrinsic = np.where(is_call, np.maximum(S - disc_K, 0), np.maximum(disc_K - S, 0))
+    return np.where(degenerate, intrinsic, price)
+
+
+def bs_price_batch(S, K, T, r, sigma, option_type=1):
+    """Vectorized bs_price over arrays of contracts.
+
+    All arguments broadcast against each other; option_type is 1 for calls
+    and anything else for puts, element-wise.
+
+    Returns:
+        np.ndarray: prices with the broadcast shape of the inputs
+    """
+    shape, (S, K, T, r, sigma), (option_type,) = broadcast_contracts((S, K, T, r, sigma), (option_type,))
+    return _bs_price_flat(S, K, T, r, sigma, option_type == 1).reshape(shape)
+
+
+def bs_greeks_batch(S, K, T, r, sigma, option_type=1):
+    """Vectorized bs_greeks over arrays of contracts.
+
+    Returns:
+        dict: same keys as bs_greeks, each mapped to an np.ndarray with the
+        broadcast shape of the inputs (NaN Greeks for degenerate contracts)
+    """
+    shape, (S, K, T, r, sigma), (option_type,) = broadcast_contracts((S, K, T, r, sigma), (option_type,))
+    is_call = option_type == 1
+    disc_K = K*np.exp(-r*T)
+
+    d1, d2, sqrt_T, degenerate = _bs_d1_d2(S, K, T, r, sigma)
+    sigma_ = np.where(degenerate, 1.0, sigma)
+    nd1 = _npdf(d1)
+
+    delta = np.where(is_call, ndtr(d1), -ndtr(-d1))
+    theta_common = -S*nd1*sigma_/(2*sqrt_T)
+    theta = np.where(is_call, theta_common - r*disc_K*ndtr(d2), theta_common + r*disc_K*ndtr(-d2))
+    rho = np.where(is_call, T*disc_K*ndtr(d2), -T*disc_K*ndtr(-d2))
+    gamma = nd1/(S*sigma_*sqrt_T)
+    vega = S*sqrt_T*nd1
+
+    results = {"Delta": delta, "Gamma": gamma, "Vega": vega, "Theta": theta, "Rho": rho}
+    for key, value in results.items():
+        results[key] = np.where(degenerate, np.nan, value).reshape(shape)
+    results['Price'] = _bs_price_flat(S, K, T, r, sigma, is_call).reshape(shape)
+    return results
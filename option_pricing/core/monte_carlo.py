@@ -1,36 +1,189 @@
 import numpy as np
 from math import sqrt, exp
 from numba import njit, prange
+from ._vectorize import broadcast_contracts, resolve_precision
+
+# Antithetic pairs per float64 partial sum in the Monte Carlo kernels.
+BLOCK_SIZE = 4096
+
+@njit(fastmath=True)
+def _pairwise_sum(values):
+    # Tree reduction of float64 partial sums; rounding error grows with
+    # log(n) rather than n.
+    n = values.shape[0]
+    if n == 0:
+        return 0.0
+    buf = values.copy()
+    while n > 1:
+        half = n // 2
+        for i in range(half):
+            buf[i] = buf[2 * i] + buf[2 * i + 1]
+        if n % 2:
+            buf[half] = buf[n - 1]
+            half += 1
+        n = half
+    return buf[0]
+
+@njit(fastmath=True)
+def _antithetic_block(S, K, drift, vol, num_pairs, option_type, ftype):
+    # Paths are simulated in ftype (float64 or float32); payoffs are
+    # accumulated in float64.
+    S_ = ftype(S)
+    K_ = ftype(K)
+    drift_ = ftype(drift)
+    vol_ = ftype(vol)
+    zero = ftype(0.0)
+
+    acc = 0.0
+    for _ in range(num_pairs):
+        Z = ftype(np.random.standard_normal())
+        S_T1 = S_ * np.exp(drift_ + vol_ * Z)
+        S_T2 = S_ * np.exp(drift_ - vol_ * Z)
+        if option_type == 1:
+            acc += max(zero, S_T1 - K_) + max(zero, S_T2 - K_)
+        else:
+            acc += max(zero, K_ - S_T1) + max(zero, K_ - S_T2)
+    return acc
 
 @njit(parallel=True, fastmath=True)
-def mc_price(S, K, T, r, sigma, num_simulations=1000000, option_type=1):
+def _sum_payoffs_blocked(S, K, drift, vol, num_half, option_type, ftype):
+    num_blocks = (num_half + BLOCK_SIZE - 1) // BLOCK_SIZE
+    block_sums = np.empty(num_blocks)
+    for b in prange(num_blocks):
+        num_pairs = min(BLOCK_SIZE, num_half - b * BLOCK_SIZE)
+        block_sums[b] = _antithetic_block(S, K, drift, vol, num_pairs, option_type, ftype)
+    return _pairwise_sum(block_sums)
+
+@njit(fastmath=True)
+def mc_price(S, K, T, r, sigma, num_simulations=1000000, option_type=1, precision='float64'):
     # option_type_int: 1=Call, -1=Put
+    # Payoffs are summed in float64 per block of BLOCK_SIZE antithetic pairs
+    # and the block sums are combined pairwise. precision='float32' simulates
+    # the paths in single precision; the rounding error is far below the
+    # Monte Carlo error.
     
     dt = T
     drift = (r - 0.5 * sigma**2) * dt
     vol = sigma * sqrt(dt)
     discount_factor = exp(-r * T)
     
-    sum_payoffs = 0.0
-    
     # Loop over half the simulations due to antithetic variates
     num_half = num_simulations // 2
     
-    for i in prange(num_half):
-        Z = np.random.standard_normal()
-        
-        # Calculate asset prices for both Z and -Z
-        S_T1 = S * exp(drift + vol * Z)
-        S_T2 = S * exp(drift - vol * Z)
-        
-        if option_type == 1:
-            payoff1 = max(0, S_T1 - K)
-            payoff2 = max(0, S_T2 - K)
-        else:
-            payoff1 = max(0, K - S_T1)
-            payoff2 = max(0, K - S_T2)
-        
-        sum_payoffs += payoff1 + payoff2
+    if precision == 'float32':
+        sum_payoffs = _sum_payoffs_blocked(S, K, drift, vol, num_half, option_type, np.float32)
+    elif precision == 'float64':
+        sum_payoffs = _sum_payoffs_blocked(S, K, drift, vol, num_half, option_type, np.float64)
+    else:
+        raise ValueError("precision must be 'float32' or 'float64'.")
     
     option_price = discount_factor * (sum_payoffs / num_simulations)
-    return float(option_price)
\ No newline at end of file
+    return float(option_price)
+
+@njit(parallel=True, fastmath=True)
+def _mc_price_batch_blocked(S, K, T, r, sigma, num_simulations, option_type, ftype):
+    out = np.empty(S.shape[0])
+    for i in prange(S.shape[0]):
+        drift = (r[i] - 0.5 * sigma[i]**2) * T[i]
+        vol = sigma[i] * sqrt(T[i])
+        num_half = num_simulations[i] // 2
+
+        num_blocks = (num_half + BLOCK_SIZE - 1) // BLOCK_SIZE
+        block_sums = np.empty(num_blocks)
+        for b in range(num_blocks):
+            num_pairs = min(BLOCK_SIZE, num_half - b * BLOCK_SIZE)
+            block_sums[b] = _antithetic_block(S[i], K[i], drift, vol, num_pairs, option_type[i], ftype)
+
+        out[i] = exp(-r[i] * T[i]) * (_pairwise_sum(block_sums) / num_simulations[i])
+    return out
+
+
+def mc_price_batch(S, K, T, r, sigma, num_simulations=1000000, option_type=1, precision='float64'):
+    """Vectorized mc_price over arrays of contracts.
+
+    All arguments broadcast against each other. Contracts are simulated in
+    parallel with antithetic variates, one contract per thread. Payoffs are
+    summed in float64 per block and the block sums combined pairwise; with
+    precision='float32' the paths are simulated in single precision.
+
+    Returns:
+        np.ndarray: float64 prices with the broadcast shape of the inputs
+
+    Raises:
+        ValueError: If any num_simulations is below 2.
+    """
+    dtype = resolve_precision(precision)
+    shape, (S, K, T, r, sigma), (num_simulations, option_type) = broadcast_contracts(
+        (S, K, T, r, sigma), (num_simulations, option_type))
+    if np.any(num_simulations < 2):
+        raise ValueError("num_simulations must be at least 2.")
+    out = _mc_price_batch_blocked(S, K, T, r, sigma, num_simulations, option_type, dtype)
+    return out.reshape(shape)
+
+
+@njit(parallel=True, fastmath=True)
+def _mc_greeks_batch(S, K, T, r, sigma, option_type, W, growth):
+    # Every contract is priced on the same draws W (both antithetic signs).
+    # growth holds exp(drift + vol * W) when T, r and sigma are shared, so
+    # the paths are simulated once; otherwise it is empty.
+    # Delta, Vega, Theta and Rho are pathwise estimators; Gamma is the
+    # pathwise-likelihood ratio estimator of the derivative of Delta.
+    out = np.empty((6, S.shape[0]))
+    for i in prange(S.shape[0]):
+        sqrt_T = sqrt(T[i])
+        drift = (r[i] - 0.5 * sigma[i]**2) * T[i]
+        vol = sigma[i] * sqrt_T
+        dlog_dT = r[i] - 0.5 * sigma[i]**2
+        price = delta = gamma = vega = theta = rho = 0.0
+        for k in range(W.shape[0]):
+            if growth.shape[0] > 0:
+                S_T = S[i] * growth[k]
+            else:
+                S_T = S[i] * exp(drift + vol * W[k])
+            if option_type[i] == 1:
+                payoff = max(0.0, S_T - K[i])
+                dpayoff = 1.0 if S_T > K[i] else 0.0
+            else:
+                payoff = max(0.0, K[i] - S_T)
+                dpayoff = -1.0 if S_T < K[i] else 0.0
+            price += payoff
+            delta += dpayoff * S_T
+            gamma += dpayoff * S_T * (W[k] / vol - 1.0)
+            vega += dpayoff * S_T * (sqrt_T * W[k] - sigma[i] * T[i])
+            theta += r[i] * payoff - dpayoff * S_T * (dlog_dT + 0.5 * sigma[i] * W[k] / sqrt_T)
+            rho += T[i] * (dpayoff * S_T - payoff)
+
+        scale = exp(-r[i] * T[i]) / W.shape[0]
+        out[0, i] = scale * delta / S[i]
+        out[1, i] = scale * gamma / S[i]**2
+        out[2, i] = scale * vega
+        out[3, i] = scale * theta
+        out[4, i] = scale * rho
+        out[5, i] = scale * price
+    return out
+
+
+def mc_greeks_batch(S, K, T, r, sigma, num_simulations=100000, option_type=1, seed=0):
+    """Monte Carlo prices and Greeks over arrays of contracts.
+
+    All arguments broadcast against each other. Every contract is priced on
+    the same num_simulations antithetic draws (common random numbers), so
+    neighbouring points of a sweep differ smoothly rather than by independent
+    noise. When T, r and sigma are scalars (a sweep over spot and/or strike)
+    the paths themselves are simulated once and rescaled per contract.
+
+    Returns:
+        dict: same keys as bs_greeks, each mapped to an np.ndarray with the
+        broadcast shape of the inputs
+    """
+    shared = all(np.ndim(a) == 0 for a in (T, r, sigma))
+    shape, (S, K, T, r, sigma), (option_type,) = broadcast_contracts((S, K, T, r, sigma), (option_type,))
+    Z = np.random.default_rng(seed).standard_normal(max(num_simulations // 2, 1))
+    W = np.concatenate((Z, -Z))
+    if shared and S.size:
+        growth = np.exp((r[0] - 0.5 * sigma[0]**2) * T[0] + sigma[0] * sqrt(T[0]) * W)
+    else:
+        growth = np.empty(0)
+    out = _mc_greeks_batch(S, K, T, r, sigma, option_type, W, growth)
+    names = ("Delta", "Gamma", "Vega", "Theta", "Rho", "Price")
+    return {name: values.reshape(shape) for name, values in zip(names, out)}
@@ -0,0 +1,223 @@
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from math import sqrt, exp
+
+import numpy as np
+from numba import njit
+from ._vectorize import resolve_precision
+from .monte_carlo import BLOCK_SIZE
+
+# Quantities accumulated per shard. Delta, Vega, Theta and Rho use pathwise
+# derivatives of the discounted payoff; Gamma, whose pathwise estimator
+# vanishes for vanilla payoffs, uses the pathwise-likelihood ratio estimator
+# of the derivative of Delta, as in mc_greeks_batch.
+STAT_NAMES = ('Price', 'Delta', 'Gamma', 'Vega', 'Theta', 'Rho')
+
+
+@dataclass
+class McStatistics:
+    """Mergeable sufficient statistics of a Monte Carlo run.
+
+    Each observation is the average of one antithetic pair of paths, so
+    count is half the number of simulated paths and the sums of squares give
+    a valid standard error.
+    """
+    count: int = 0
+    sums: np.ndarray = field(default_factory=lambda: np.zeros(len(STAT_NAMES)))
+    sumsqs: np.ndarray = field(default_factory=lambda: np.zeros(len(STAT_NAMES)))
+
+    def merge(self, other: 'McStatistics') -> 'McStatistics':
+        """Return the statistics of both runs combined."""
+        return McStatistics(self.count + other.count, self.sums + other.sums, self.sumsqs + other.sumsqs)
+
+    def estimates(self) -> dict[str, float]:
+        """Return {'Price', 'Delta', 'Gamma', 'Vega', 'Theta', 'Rho'} sample means."""
+        if self.count == 0:
+            return {name: float('nan') for name in STAT_NAMES}
+        return {name: float(value) for name, value in zip(STAT_NAMES, self.sums / self.count)}
+
+    def stderrs(self) -> dict[str, float]:
+        """Return the standard error of each estimate."""
+        if self.count < 2:
+            return {name: float('nan') for name in STAT_NAMES}
+        mean = self.sums / self.count
+        variance = np.maximum(self.sumsqs - self.count * mean**2, 0.0) / (self.count - 1)
+        return {name: float(value) for name, value in zip(STAT_NAMES, np.sqrt(variance / self.count))}
+
+    def to_dict(self) -> dict:
+        return {'count': self.count, 'sums': self.sums.tolist(), 'sumsqs': self.sumsqs.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'McStatistics':
+        return cls(int(data['count']), np.array(data['sums'], dtype=np.float64),
+                   np.array(data['sumsqs'], dtype=np.float64))
+
+
+@njit(fastmath=True)
+def _mc_shard_kernel(S, K, T, r, sigma, num_pairs, seed, option_type, ftype):
+    # Paths and per-path values are computed in ftype; accumulation is in
+    # float64, first per block of BLOCK_SIZE pairs and then across blocks.
+    np.random.seed(seed)
+    S_ = ftype(S)
+    K_ = ftype(K)
+    T_ = ftype(T)
+    sigma_ = ftype(sigma)
+    sqrt_T = ftype(sqrt(T))
+    r_ = ftype(r)
+    drift = ftype((r - 0.5 * sigma**2) * T)
+    vol = ftype(sigma * sqrt(T))
+    dlog_dT = ftype(r - 0.5 * sigma**2)
+    half_discount = ftype(0.5 * exp(-r * T))
+    zero = ftype(0.0)
+    one = ftype(1.0)
+
+    n_stats = len(STAT_NAMES)
+    sums = np.zeros(n_stats)
+    sumsqs = np.zeros(n_stats)
+    block_sums = np.zeros(n_stats)
+    block_sumsqs = np.zeros(n_stats)
+    values = np.empty(n_stats)
+    for i in range(num_pairs):
+        Z = ftype(np.random.standard_normal())
+        values[:] = 0.0
+        for sign in (one, -one):
+            W = sign * Z
+            S_T = S_ * np.exp(drift + vol * W)
+            if option_type == 1:
+                payoff = max(zero, S_T - K_)
+                dpayoff = one if S_T > K_ else zero
+            else:
+                payoff = max(zero, K_ - S_T)
+                dpayoff = -one if S_T < K_ else zero
+            values[0] += half_discount * payoff
+            values[1] += half_discount * dpayoff * S_T / S_
+            values[2] += half_discount * dpayoff * S_T * (W / vol - one) / (S_ * S_)
+            values[3] += half_discount * dpayoff * S_T * (sqrt_T * W - sigma_ * T_)
+            values[4] += half_discount * (r_ * payoff - dpayoff * S_T * (dlog_dT + ftype(0.5) * sigma_ * W / sqrt_T))
+            values[5] += half_discount * (dpayoff * S_T * T_ - T_ * payoff)
+        for k in range(n_stats):
+            block_sums[k] += values[k]
+            block_sumsqs[k] += values[k] * values[k]
+        if (i + 1) % BLOCK_SIZE == 0 or i == num_pairs - 1:
+            sums += block_sums
+            sumsqs += block_sumsqs
+            block_sums[:] = 0.0
+            block_sumsqs[:] = 0.0
+    return sums, sumsqs
+
+
+def shard_seed(seed: int, index: int) -> int:
+    """Deterministic RNG seed for shard `index` of a run seeded with `seed`."""
+    return int(np.random.SeedSequence([seed, index]).generate_state(1)[0])
+
+
+def mc_shard(S, K, T, r, sigma, num_paths, seed, option_type=1, precision='float64') -> McStatistics:
+    """Simulate one shard of num_paths paths (rounded down to whole antithetic pairs).
+
+    With precision='float32' paths are simulated in single precision; the
+    statistics are always accumulated in float64.
+
+    Returns:
+        McStatistics: the shard's sufficient statistics
+    """
+    ftype = resolve_precision(precision)
+    num_pairs = num_paths // 2
+    sums, sumsqs = _mc_shard_kernel(float(S), float(K), float(T), float(r), float(sigma),
+                                    num_pairs, seed, option_type, ftype)
+    return McStatistics(num_pairs, sums, sumsqs)
+
+
+def _shard_sizes(num_paths, shard_paths):
+    full, rest = divmod(num_paths, shard_paths)
+    return [shard_paths] * full + ([rest] if rest else [])
+
+
+def _write_json(path, data):
+    # Write then rename, so an interrupted run never leaves a partial file.
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _load_checkpoint(checkpoint_dir, run):
+    """Return {shard index: McStatistics} already completed for this run."""
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    run_path = os.path.join(checkpoint_dir, 'run.json')
+    if os.path.exists(run_path):
+        with open(run_path) as f:
+            if json.load(f) != run:
+                raise ValueError(f"Checkpoint directory {checkpoint_dir} belongs to a different run.")
+    else:
+        _write_json(run_path, run)
+
+    completed = {}
+    for name in os.listdir(checkpoint_dir):
+        if name.startswith('shard_') and name.endswith('.json'):
+            with open(os.path.join(checkpoint_dir, name)) as f:
+                completed[int(name[6:-5])] = McStatistics.from_dict(json.load(f))
+    return completed
+
+
+def mc_price_sharded(S, K, T, r, sigma, num_paths, option_type=1, shard_paths=10_000_000, seed=0,
+                     checkpoint_dir=None, max_workers=None, executor: Executor | None = None,
+                     precision='float64') -> McStatistics:
+    """Run a large Monte Carlo simulation as independent shards on a process pool.
+
+    Shard i simulates with seed shard_seed(seed, i), so the result depends only
+    on (seed, num_paths, shard_paths) and not on the number of workers or the
+    order shards finish in; shards are always merged in index order. When
+    checkpoint_dir is given, each completed shard is saved there and a rerun
+    with the same arguments skips shards already on disk.
+
+    Args:
+        num_paths: total number of paths across all shards
+        shard_paths: paths per shard (the last shard may be smaller)
+        seed: base seed for the run
+        checkpoint_dir: directory for resumable shard results, or None
+        max_workers: process pool size when no executor is given
+        executor: any concurrent.futures executor to run shards on
+        precision: 'float64' or 'float32' path simulation, see mc_shard
+
+    Returns:
+        McStatistics: merged statistics; see estimates() and stderrs()
+
+    Raises:
+        ValueError: If checkpoint_dir holds shards from a different run.
+    """
+    if num_paths < 2 or shard_paths < 2:
+        raise ValueError("num_paths and shard_paths must be at least 2.")
+    resolve_precision(precision)
+    sizes = _shard_sizes(num_paths, shard_paths)
+    completed = {}
+    if checkpoint_dir is not None:
+        run = {'S': float(S), 'K': float(K), 'T': float(T), 'r': float(r), 'sigma': float(sigma),
+               'option_type': int(option_type), 'num_paths': int(num_paths),
+               'shard_paths': int(shard_paths), 'seed': int(seed), 'precision': precision,
+               'stats': list(STAT_NAMES)}
+        completed = _load_checkpoint(checkpoint_dir, run)
+
+    pending = [i for i in range(len(sizes)) if i not in completed]
+    if pending:
+        owns_executor = executor is None
+        if owns_executor:
+            executor = ProcessPoolExecutor(max_workers)
+        try:
+            futures = {executor.submit(mc_shard, S, K, T, r, sigma, sizes[i], shard_seed(seed, i),
+                                       option_type, precision): i
+                       for i in pending}
+            for future in as_completed(futures):
+                i = futures[future]
+                completed[i] = future.result()
+                if checkpoint_dir is not None:
+                    _write_json(os.path.join(checkpoint_dir, f'shard_{i:06d}.json'), completed[i].to_dict())
+        finally:
+            if owns_executor:
+                executor.shutdown(cancel_futures=True)
+
+    stats = McStatistics()
+    for i in range(len(sizes)):
+        stats = stats.merge(completed[i])
+    return stats
@@ -0,0 +1,195 @@
+from math import sqrt, exp
+from typing import Iterator, NamedTuple
+
+import numpy as np
+from numba import njit, prange
+from scipy.stats import norm
+
+from .binomial_tree import _bt_kernel
+from .monte_carlo import BLOCK_SIZE, _pairwise_sum
+
+
+class Estimate(NamedTuple):
+    """One refinement of a progressive price.
+
+    resolution is the number of paths (Monte Carlo) or tree steps (binomial)
+    behind the estimate; error is a confidence half-width (Monte Carlo) or
+    the change from the previous extrapolated price (binomial).
+    """
+    resolution: int
+    price: float
+    error: float
+
+
+@njit(parallel=True, fastmath=True, nogil=True)
+def _mc_moments(S, K, drift, vol, discount, num_pairs, option_type):
+    # Sum and sum of squares of discounted antithetic pair averages.
+    num_blocks = (num_pairs + BLOCK_SIZE - 1) // BLOCK_SIZE
+    sums = np.empty(num_blocks)
+    sumsqs = np.empty(num_blocks)
+    for b in prange(num_blocks):
+        s = 0.0
+        ss = 0.0
+        for _ in range(min(BLOCK_SIZE, num_pairs - b * BLOCK_SIZE)):
+            Z = np.random.standard_normal()
+            S_T1 = S * exp(drift + vol * Z)
+            S_T2 = S * exp(drift - vol * Z)
+            if option_type == 1:
+                value = 0.5 * discount * (max(0.0, S_T1 - K) + max(0.0, S_T2 - K))
+            else:
+                value = 0.5 * discount * (max(0.0, K - S_T1) + max(0.0, K - S_T2))
+            s += value
+            ss += value * value
+        sums[b] = s
+        sumsqs[b] = ss
+    return _pairwise_sum(sums), _pairwise_sum(sumsqs)
+
+
+# Tree nodes per kernel call in the progressive binomial pricer, so a
+# cancelled tree stops within a few milliseconds whatever its size.
+BT_CHUNK_NODES = 1_000_000
+
+
+@njit(fastmath=True, nogil=True)
+def _bt_leaves(S, K, T, sigma, steps, option_type):
+    # Same arithmetic as _bt_kernel, so finished trees match bt_price exactly.
+    dt = T / steps
+    u = exp(sigma * sqrt(dt))
+    d = 1 / u
+    values = np.empty(steps + 1)
+    for j in range(steps + 1):
+        asset_price = S * (u ** j) * (d ** (steps - j))
+        if option_type == 1:
+            values[j] = max(0.0, asset_price - K)
+        else:
+            values[j] = max(0.0, K - asset_price)
+    return values
+
+
+@njit(fastmath=True, nogil=True)
+def _bt_rows(values, S, K, T, r, sigma, steps, option_type, is_american, top, bottom):
+    # Backward induction from row top - 1 down to row bottom, in place.
+    dt = T / steps
+    u = exp(sigma * sqrt(dt))
+    d = 1 / u
+    p = (exp(r * dt) - d) / (u - d)
+    discount = exp(-r * dt)
+    for i in range(top - 1, bottom - 1, -1):
+        for j in range(i + 1):
+            values[j] = discount * (p * values[j + 1] + (1 - p) * values[j])
+            if is_american:
+                asset_price = S * (u ** j) * (d ** (i - j))
+                if option_type == 1:
+                    exercise_value = max(0.0, asset_price - K)
+                else:
+                    exercise_value = max(0.0, K - asset_price)
+                values[j] = max(values[j], exercise_value)
+
+
+def _bt_price_chunked(S, K, T, r, sigma, steps, option_type, is_american, cancel):
+    """bt_price in chunks of rows; returns None once cancel is set."""
+    values = _bt_leaves(S, K, T, sigma, steps, option_type)
+    top = steps
+    while top > 0:
+        if cancel is not None and cancel.is_set():
+            return None
+        bottom = max(top - max(BT_CHUNK_NODES // (top + 1), 1), 0)
+        _bt_rows(values, S, K, T, r, sigma, steps, option_type, is_american, top, bottom)
+        top = bottom
+    return float(values[0])
+
+
+def mc_price_progressive(S, K, T, r, sigma, num_simulations=1000000, option_type=1,
+                         first_batch=16384, max_batch=2097152, confidence=0.95,
+                         tolerance=None, cancel=None) -> Iterator[Estimate]:
+    """Monte Carlo price that refines as more paths are simulated.
+
+    Simulates antithetic paths in batches that start at first_batch paths
+    and double up to max_batch, yielding the running estimate and its
+    confidence half-width after each batch. Stops after num_simulations
+    paths, or earlier once the half-width is at most tolerance, or once
+    cancel (a threading.Event) is set.
+
+    Yields:
+        Estimate: (paths so far, price, confidence half-width)
+    """
+    z = float(norm.ppf(0.5 + confidence / 2))
+    drift = (r - 0.5 * sigma**2) * T
+    vol = sigma * sqrt(T)
+    discount = exp(-r * T)
+
+    total_pairs = max(num_simulations // 2, 1)
+    batch_pairs = max(first_batch // 2, 1)
+    done = 0
+    total = 0.0
+    total_sq = 0.0
+    while done < total_pairs:
+        if cancel is not None and cancel.is_set():
+            return
+        num_pairs = min(batch_pairs, total_pairs - done)
+        s, ss = _mc_moments(S, K, drift, vol, discount, num_pairs, option_type)
+        total += s
+        total_sq += ss
+        done += num_pairs
+
+        mean = total / done
+        if done > 1:
+            variance = max(total_sq - done * mean**2, 0.0) / (done - 1)
+            error = z * sqrt(variance / done)
+        else:
+            error = float('nan')
+        yield Estimate(2 * done, mean, error)
+
+        if tolerance is not None and error <= tolerance:
+            return
+        batch_pairs = min(2 * batch_pairs, max(max_batch // 2, 1))
+
+
+def bt_price_progressive(S, K, T, r, sigma, steps=100, option_type=1, style='european',
+                         min_steps=16, tolerance=None, cancel=None) -> Iterator[Estimate]:
+    """Binomial price that refines through increasing step counts.
+
+    Prices the tree at steps, steps//2, steps//4, ... (smallest first, none
+    below min_steps), averaging n and n+1 steps to damp the odd/even
+    oscillation, and Richardson-extrapolates consecutive levels assuming
+    error proportional to 1/n. The last estimate is the plain steps tree,
+    equal to bt_price, with the distance to the extrapolated price as its
+    error. Stops earlier once successive extrapolated prices differ by at
+    most tolerance. Trees are priced in chunks of rows, and setting cancel
+    (a threading.Event) stops the generator within one chunk.
+
+    Yields:
+        Estimate: (steps, price, change from previous estimate or, for the
+        last one, distance from the extrapolated price)
+    """
+    is_american = style == 'american'
+    levels = []
+    n = steps
+    while n >= min_steps:
+        levels.append(n)
+        n //= 2
+    levels = levels[::-1] or [steps]
+
+    previous_n = previous_smoothed = previous_price = None
+    for n in levels:
+        trees = []
+        for size in (n, n + 1):
+            tree = _bt_price_chunked(S, K, T, r, sigma, size, option_type, is_american, cancel)
+            if tree is None:
+                return
+            trees.append(tree)
+        smoothed = 0.5 * (trees[0] + trees[1])
+        if previous_n is None:
+            price, error = smoothed, float('nan')
+        else:
+            price = smoothed + (smoothed - previous_smoothed) * previous_n / (n - previous_n)
+            error = abs(price - previous_price)
+
+        if n == levels[-1]:
+            yield Estimate(n, trees[0], float(abs(trees[0] - price)))
+            return
+        yield Estimate(n, float(price), float(error))
+
+        if tolerance is not None and error <= tolerance:
+            return
+        previous_n, previous_smoothed, previous_price = n, smoothed, price
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import QApplication
-from controller.app import MainWindow
+from .controller.app import MainWindow
 import sys
 
 if __name__ == "__main__":
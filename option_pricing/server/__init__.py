@@ -0,0 +1,5 @@
+from .batcher import MicroBatcher
+from .client import PricingClient, PricingServerError
+from .pricing_server import PricingServer, serve
+
+__all__ = ['MicroBatcher', 'PricingClient', 'PricingServer', 'PricingServerError', 'serve']
@@ -0,0 +1,27 @@
+import argparse
+import asyncio
+
+from .pricing_server import serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local option pricing server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--max-batch-size', type=int, default=256)
+    parser.add_argument('--max-delay', type=float, default=0.002, help="micro-batch window in seconds")
+    parser.add_argument('--max-pending', type=int, default=1024)
+    parser.add_argument('--request-timeout', type=float, default=30.0)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, max_batch_size=args.max_batch_size,
+                          max_delay=args.max_delay, max_pending=args.max_pending,
+                          request_timeout=args.request_timeout, max_workers=args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
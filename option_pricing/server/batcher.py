@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class MicroBatcher:
+    """Coalesces concurrent single-item requests into micro-batches.
+
+    Items submitted under the same key are collected until either
+    max_batch_size items are waiting or max_delay seconds have passed since
+    the first one arrived, then handed to run_batch in a single call.
+    """
+
+    def __init__(self, run_batch: Callable[[Hashable, list[Any]], Awaitable[list[Any]]],
+                 max_batch_size: int = 256, max_delay: float = 0.002):
+        """Initialize the batcher.
+
+        Args:
+            run_batch: coroutine function (key, items) -> results, one result per item
+            max_batch_size: flush a key as soon as this many items are waiting
+            max_delay: seconds to wait for more items before flushing
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative.")
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: dict[Hashable, list[tuple[Any, asyncio.Future]]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((item, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.max_delay, self._flush, key)
+        return await future
+
+    async def close(self) -> None:
+        """Flush everything still waiting and wait for in-flight batches."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self, key: Hashable) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._dispatch(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, key: Hashable, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        # Requests that timed out while waiting are dropped from the batch.
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+        try:
+            results = await self.run_batch(key, [item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,93 @@
+import asyncio
+import itertools
+import json
+from typing import Any
+
+from .pricing_server import MAX_LINE_BYTES
+
+
+class PricingServerError(Exception):
+    """Raised when the pricing server answers a request with an error."""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+
+
+class PricingClient:
+    """Async client for PricingServer; requests may be issued concurrently."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765):
+        self.host = host
+        self.port = port
+        self._ids = itertools.count()
+        self._waiting: dict[int, asyncio.Future] = {}
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._receiver: asyncio.Task | None = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port, limit=MAX_LINE_BYTES)
+        self._receiver = asyncio.create_task(self._receive())
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        if self._receiver is not None:
+            self._receiver.cancel()
+            await asyncio.gather(self._receiver, return_exceptions=True)
+
+    async def request(self, method: str, params: dict[str, Any] | None = None,
+                      timeout: float | None = None) -> Any:
+        """Send one request and wait for its result.
+
+        Args:
+            method: server method name (price, price_batch, calculate_bs, ...)
+            params: method parameters
+            timeout: server-side timeout in seconds; server default if None
+
+        Raises:
+            PricingServerError: If the server reports an error.
+        """
+        request_id = next(self._ids)
+        message = {'id': request_id, 'method': method, 'params': params or {}}
+        if timeout is not None:
+            message['timeout'] = timeout
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps(message).encode() + b'\n')
+        await self._writer.drain()
+        return await future
+
+    async def price(self, engine: str = 'bs', timeout: float | None = None, **contract) -> float:
+        """Price a single contract; the server batches it with concurrent requests."""
+        return await self.request('price', {'engine': engine, **contract}, timeout)
+
+    async def _receive(self) -> None:
+        try:
+            while line := await self._reader.readline():
+                response = json.loads(line)
+                future = self._waiting.pop(response.get('id'), None)
+                if future is None or future.done():
+                    continue
+                if 'error' in response:
+                    error = response['error']
+                    future.set_exception(PricingServerError(error['type'], error['message']))
+                else:
+                    future.set_result(response['result'])
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection to pricing server closed."))
+            self._waiting.clear()
@@ -0,0 +1,117 @@
+"""
+Load generator for the pricing server.
+
+Runs closed-loop clients at several concurrency levels and reports p50/p99
+latency and throughput for single-contract price requests:
+
+    python -m option_pricing.server.load_generator --levels 1 8 32 128
+    python -m option_pricing.server.load_generator --spawn --engine bt
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+
+from .client import PricingClient
+from .pricing_server import PricingServer
+
+
+def _random_contract(engine: str, rng: random.Random) -> dict:
+    contract = {
+        'S': rng.uniform(80, 120),
+        'K': 100.0,
+        'T': rng.uniform(0.1, 2.0),
+        'r': 0.05,
+        'sigma': rng.uniform(0.1, 0.5),
+        'option_type': rng.choice((0, 1)),
+    }
+    if engine == 'bt':
+        contract['steps'] = 200
+    elif engine == 'mc':
+        contract['num_simulations'] = 20000
+    return contract
+
+
+async def run_level(host: str, port: int, concurrency: int, requests_per_client: int,
+                    engine: str = 'bs', seed: int = 0) -> dict[str, float]:
+    """Drive the server with `concurrency` clients issuing requests back to back.
+
+    Returns:
+        dict: {'concurrency', 'requests', 'errors', 'p50_ms', 'p99_ms', 'throughput'}
+    """
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(index: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed * 100003 + index)
+        async with PricingClient(host, port) as client:
+            for _ in range(requests_per_client):
+                contract = _random_contract(engine, rng)
+                start = time.perf_counter()
+                try:
+                    await client.price(engine, **contract)
+                except Exception:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    samples = np.array(latencies) * 1e3 if latencies else np.array([np.nan])
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors,
+        'p50_ms': float(np.percentile(samples, 50)),
+        'p99_ms': float(np.percentile(samples, 99)),
+        'throughput': len(latencies) / elapsed,
+    }
+
+
+def format_report(rows: list[dict[str, float]]) -> str:
+    lines = [f"{'clients':>8} {'requests':>9} {'errors':>7} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>10}"]
+    for row in rows:
+        lines.append(f"{row['concurrency']:>8} {row['requests']:>9} {row['errors']:>7} "
+                     f"{row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['throughput']:>10.0f}")
+    return "\n".join(lines)
+
+
+async def run(host: str, port: int, levels: list[int], requests_per_client: int, engine: str,
+              spawn: bool = False) -> list[dict[str, float]]:
+    server = None
+    if spawn:
+        server = PricingServer(host, 0)
+        await server.start()
+        port = server.port
+    try:
+        # Warm-up pass so JIT compilation is not counted in the first level.
+        await run_level(host, port, 1, 5, engine)
+        return [await run_level(host, port, level, requests_per_client, engine) for level in levels]
+    finally:
+        if server is not None:
+            await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure pricing server latency and throughput.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 8, 32, 128])
+    parser.add_argument('--requests', type=int, default=200, help="requests per client")
+    parser.add_argument('--engine', choices=('bs', 'bt', 'mc'), default='bs')
+    parser.add_argument('--spawn', action='store_true', help="start an in-process server on a free port")
+    args = parser.parse_args()
+
+    rows = asyncio.run(run(args.host, args.port, args.levels, args.requests, args.engine, args.spawn))
+    print(f"Engine: {args.engine}")
+    print(format_report(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+import numba
+
+from ..controller.pricing_service import PricingService
+from ..core import bs_price_batch, bt_price_batch, mc_price_batch
+from .batcher import MicroBatcher
+
+ENGINES = {'bs': bs_price_batch, 'bt': bt_price_batch, 'mc': mc_price_batch}
+
+# Per-contract columns each engine accepts, with the defaults used when a
+# request leaves them out.
+ENGINE_COLUMNS = {
+    'bs': {'S': None, 'K': None, 'T': None, 'r': None, 'sigma': None, 'option_type': 1},
+    'bt': {'S': None, 'K': None, 'T': None, 'r': None, 'sigma': None, 'steps': 100, 'option_type': 1},
+    'mc': {'S': None, 'K': None, 'T': None, 'r': None, 'sigma': None, 'num_simulations': 100000, 'option_type': 1},
+}
+
+# Integer columns, with their smallest valid value.
+INT_COLUMNS = {'steps': 1, 'num_simulations': 2, 'option_type': 0}
+
+# Per-batch options each engine accepts, with their defaults. Single-contract
+# requests are only batched together when their options match.
+ENGINE_OPTIONS = {
+    'bs': {},
+    'bt': {'style': 'european'},
+    'mc': {'precision': 'float64'},
+}
+
+SERVICE_METHODS = ('calculate_bs', 'calculate_bt', 'calculate_mc', 'calculate_auto')
+
+# Large enough for price_batch requests carrying ~100k contracts.
+MAX_LINE_BYTES = 2**26
+
+
+class RequestError(Exception):
+    """Raised for malformed or unsupported requests."""
+
+
+def _init_worker() -> None:
+    """Process pool initializer: single-threaded kernels, compiled up front.
+
+    The pool already runs one worker per core, so letting each worker's
+    parallel numba kernels use every core as well would oversubscribe the
+    machine with cores^2 threads.
+    """
+    numba.set_num_threads(1)
+    _warm_up()
+
+
+def _warm_up() -> None:
+    """JIT-compile the kernels used by the server in this process."""
+    for engine, columns in ENGINE_COLUMNS.items():
+        contract = {name: (1.0 if default is None else default) for name, default in columns.items()}
+        contract.update(steps=2, num_simulations=2)
+        _run_engine(engine, contract, ENGINE_OPTIONS[engine])
+    params = {'S': 1.0, 'K': 1.0, 'T': 1.0, 'r': 0.0, 'sigma': 1.0}
+    PricingService.calculate_bt(params, 2, 'european')
+    PricingService.calculate_mc(params, 2)
+
+
+def _run_engine(engine: str, columns: dict[str, Any], options: dict[str, Any]) -> list[float]:
+    """Worker entry point: price one batch of contracts with a batch engine."""
+    columns = {name: value for name, value in columns.items() if name in ENGINE_COLUMNS[engine]}
+    return ENGINES[engine](**columns, **options).tolist()
+
+
+def _run_service(method: str, kwargs: dict[str, Any]) -> Any:
+    """Worker entry point: call a PricingService method."""
+    return getattr(PricingService, method)(**kwargs)
+
+
+def _contract_columns(engine: str, params: dict[str, Any], scalar: bool = False) -> dict[str, Any]:
+    """Collect an engine's contract columns from request params.
+
+    With scalar=True (single-contract requests) each field is checked to be
+    one finite number here, so a bad request is rejected on its own instead
+    of failing the micro-batch it would join.
+    """
+    if engine not in ENGINE_COLUMNS:
+        raise RequestError(f"Unknown engine: {engine!r}.")
+    columns = {}
+    for name, default in ENGINE_COLUMNS[engine].items():
+        value = params.get(name, default)
+        if value is None:
+            raise RequestError(f"Missing parameter: {name}.")
+        columns[name] = _scalar(name, value) if scalar else value
+    return columns
+
+
+def _scalar(name: str, value: Any) -> float | int:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise RequestError(f"Parameter {name} must be a finite number.")
+    if name not in INT_COLUMNS:
+        return float(value)
+    if value != int(value) or value < INT_COLUMNS[name]:
+        raise RequestError(f"Parameter {name} must be an integer of at least {INT_COLUMNS[name]}.")
+    return int(value)
+
+
+def _engine_options(engine: str, params: dict[str, Any]) -> dict[str, Any]:
+    return {name: params.get(name, default) for name, default in ENGINE_OPTIONS[engine].items()}
+
+
+class PricingServer:
+    """Local asyncio pricing server speaking newline-delimited JSON over TCP.
+
+    Each request line is an object {"id", "method", "params", "timeout"?};
+    each response line is {"id", "result"} or {"id", "error"}. Methods:
+
+        price        single contract; coalesced into micro-batches per engine
+                     and options (style for bt, precision for mc)
+        price_batch  column lists for many contracts; sent straight to the pool
+        calculate_bs / calculate_bt / calculate_mc / calculate_auto
+                     PricingService methods, params passed as keyword arguments
+        ping         liveness check
+
+    Concurrency is bounded by max_pending: once that many requests are in
+    flight the server stops reading from its sockets, so clients see TCP
+    backpressure instead of an unbounded queue.
+
+    A timed-out request gets an error response, but its kernel call cannot
+    be interrupted: the job keeps its pool worker busy until it finishes.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, max_batch_size: int = 256,
+                 max_delay: float = 0.002, max_pending: int = 1024, request_timeout: float = 30.0,
+                 max_workers: int | None = None, executor: Executor | None = None):
+        """Initialize the server.
+
+        Args:
+            host, port: address to listen on (port 0 picks a free port)
+            max_batch_size: most single-contract requests per micro-batch
+            max_delay: seconds to wait for a micro-batch to fill
+            max_pending: most requests in flight across all connections
+            request_timeout: default per-request timeout in seconds
+            max_workers: process pool size when no executor is given (default:
+                one per core; each worker runs its kernels single-threaded)
+            executor: executor to run kernels on; defaults to a warmed-up
+                ProcessPoolExecutor owned by the server
+        """
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.request_timeout = request_timeout
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batcher = MicroBatcher(self._run_batch, max_batch_size, max_delay)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._slots: asyncio.Semaphore | None = None
+        self._server: asyncio.base_events.Server | None = None
+        self._connections: set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the executor and begin listening."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers, initializer=_init_worker)
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=MAX_LINE_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, finish queued batches and shut down an owned executor."""
+        if self._server is not None:
+            self._server.close()
+            for connection in list(self._connections):
+                connection.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.close()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def handle(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Process one decoded request and build its response."""
+        request_id = message.get('id')
+        timeout = message.get('timeout', self.request_timeout)
+        try:
+            result = await asyncio.wait_for(self._dispatch(message), timeout)
+        except asyncio.TimeoutError:
+            return {'id': request_id, 'error': {'type': 'timeout', 'message': f"Request exceeded {timeout}s."}}
+        except (RequestError, ValueError) as e:
+            return {'id': request_id, 'error': {'type': 'bad_request', 'message': str(e)}}
+        except Exception as e:
+            return {'id': request_id, 'error': {'type': 'internal', 'message': str(e)}}
+        return {'id': request_id, 'result': result}
+
+    async def _dispatch(self, message: dict[str, Any]) -> Any:
+        method = message.get('method')
+        params = message.get('params') or {}
+        if not isinstance(params, dict):
+            raise RequestError("params must be an object.")
+
+        if method == 'ping':
+            return 'pong'
+        if method == 'price':
+            engine = params.get('engine', 'bs')
+            columns = _contract_columns(engine, params, scalar=True)
+            options = _engine_options(engine, params)
+            return await self.batcher.submit((engine, tuple(options.items())), columns)
+        if method == 'price_batch':
+            engine = params.get('engine', 'bs')
+            columns = _contract_columns(engine, params)
+            return await self._run_in_executor(_run_engine, engine, columns, _engine_options(engine, params))
+        if method in SERVICE_METHODS:
+            return await self._run_in_executor(_run_service, method, params)
+        raise RequestError(f"Unknown method: {method!r}.")
+
+    async def _run_batch(self, key: tuple[str, tuple], contracts: list[dict[str, Any]]) -> list[float]:
+        engine, options = key
+        columns = {name: [contract[name] for contract in contracts] for name in ENGINE_COLUMNS[engine]}
+        return await self._run_in_executor(_run_engine, engine, columns, dict(options))
+
+    async def _run_in_executor(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task] = set()
+
+        async def respond(message: dict[str, Any]) -> None:
+            try:
+                response = await self.handle(message)
+                async with write_lock:
+                    writer.write(json.dumps(response).encode() + b'\n')
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                self._slots.release()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    if not isinstance(message, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    response = {'id': None, 'error': {'type': 'bad_request', 'message': f"Invalid JSON: {e}"}}
+                    async with write_lock:
+                        writer.write(json.dumps(response).encode() + b'\n')
+                        await writer.drain()
+                    continue
+                # Wait for a free slot before dispatching (and before reading
+                # this connection's next line), so a saturated server pushes
+                # back on clients through TCP flow control while idle
+                # connections hold no slot. The response task owns the slot.
+                await self._slots.acquire()
+                task = asyncio.create_task(respond(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, ValueError, asyncio.CancelledError):
+            # Dropped connections, oversized lines and close() all end the
+            # handler quietly.
+            pass
+        finally:
+            self._connections.discard(connection)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, **kwargs) -> None:
+    """Run a PricingServer until cancelled."""
+    async with PricingServer(host, port, **kwargs) as server:
+        print(f"Pricing server listening on {server.host}:{server.port}", flush=True)
+        await server.serve_forever()
@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'calculator.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.10.0
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -15,17 +15,17 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QFrame,
-    QGroupBox, QHeaderView, QLabel, QLineEdit,
-    QMainWindow, QMenuBar, QPushButton, QRadioButton,
-    QSizePolicy, QStatusBar, QTableWidget, QTableWidgetItem,
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+    QFrame, QGroupBox, QHeaderView, QLabel,
+    QLineEdit, QMainWindow, QMenuBar, QPushButton,
+    QRadioButton, QSizePolicy, QStatusBar, QTableView,
     QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         if not MainWindow.objectName():
             MainWindow.setObjectName(u"MainWindow")
-        MainWindow.resize(617, 483)
+        MainWindow.resize(617, 763)
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         self.KeyParams_GroupBox = QGroupBox(self.centralwidget)
@@ -85,30 +85,37 @@ class Ui_MainWindow(object):
         self.NumSimMax_Button = QPushButton(self.MC_GroupBox)
         self.NumSimMax_Button.setObjectName(u"NumSimMax_Button")
         self.NumSimMax_Button.setGeometry(QRect(220, 39, 41, 21))
-        self.tableWidget = QTableWidget(self.centralwidget)
-        if (self.tableWidget.columnCount() < 3):
-            self.tableWidget.setColumnCount(3)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        if (self.tableWidget.rowCount() < 2):
-            self.tableWidget.setRowCount(2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(0, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.tableWidget.setVerticalHeaderItem(1, __qtablewidgetitem4)
-        self.tableWidget.setObjectName(u"tableWidget")
-        self.tableWidget.setEnabled(True)
-        self.tableWidget.setGeometry(QRect(20, 260, 361, 81))
-        self.tableWidget.setFrameShape(QFrame.StyledPanel)
-        self.tableWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.tableWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.tableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tableWidget.setSelectionMode(QAbstractItemView.NoSelection)
-        self.tableWidget.setTextElideMode(Qt.ElideNone)
+        self.tableView = QTableView(self.centralwidget)
+        self.tableView.setObjectName(u"tableView")
+        self.tableView.setEnabled(True)
+        self.tableView.setGeometry(QRect(20, 260, 481, 81))
+        self.tableView.setFrameShape(QFrame.StyledPanel)
+        self.tableView.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.tableView.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.tableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tableView.setSelectionMode(QAbstractItemView.NoSelection)
+        self.tableView.setTextElideMode(Qt.ElideNone)
+        self.Stop_Button = QPushButton(self.centralwidget)
+        self.Stop_Button.setObjectName(u"Stop_Button")
+        self.Stop_Button.setGeometry(QRect(510, 260, 91, 24))
+        self.Chart_GroupBox = QGroupBox(self.centralwidget)
+        self.Chart_GroupBox.setObjectName(u"Chart_GroupBox")
+        self.Chart_GroupBox.setGeometry(QRect(20, 350, 581, 361))
+        self.ChartParameter = QLabel(self.Chart_GroupBox)
+        self.ChartParameter.setObjectName(u"ChartParameter")
+        self.ChartParameter.setGeometry(QRect(10, 30, 41, 16))
+        self.ChartParameter_ComboBox = QComboBox(self.Chart_GroupBox)
+        self.ChartParameter_ComboBox.setObjectName(u"ChartParameter_ComboBox")
+        self.ChartParameter_ComboBox.setGeometry(QRect(60, 27, 151, 22))
+        self.ChartQuantity = QLabel(self.Chart_GroupBox)
+        self.ChartQuantity.setObjectName(u"ChartQuantity")
+        self.ChartQuantity.setGeometry(QRect(240, 30, 41, 16))
+        self.ChartQuantity_ComboBox = QComboBox(self.Chart_GroupBox)
+        self.ChartQuantity_ComboBox.setObjectName(u"ChartQuantity_ComboBox")
+        self.ChartQuantity_ComboBox.setGeometry(QRect(290, 27, 111, 22))
+        self.chartContainer = QWidget(self.Chart_GroupBox)
+        self.chartContainer.setObjectName(u"chartContainer")
+        self.chartContainer.setGeometry(QRect(10, 60, 561, 291))
         self.EuropeanStyle_RadioButton = QRadioButton(self.centralwidget)
         self.EuropeanStyle_RadioButton.setObjectName(u"EuropeanStyle_RadioButton")
         self.EuropeanStyle_RadioButton.setGeometry(QRect(30, 30, 100, 20))
@@ -135,7 +142,9 @@ class Ui_MainWindow(object):
         self.KeyParams_GroupBox.raise_()
         self.BT_GroupBox.raise_()
         self.MC_GroupBox.raise_()
-        self.tableWidget.raise_()
+        self.tableView.raise_()
+        self.Stop_Button.raise_()
+        self.Chart_GroupBox.raise_()
         self.EuropeanStyle_RadioButton.raise_()
         self.AmericanStyle_RadioButton.raise_()
         self.PricingModel_GroupBox.raise_()
@@ -166,16 +175,13 @@ class Ui_MainWindow(object):
         self.MC_GroupBox.setTitle(QCoreApplication.translate("MainWindow", u"Monte Carlo Input", None))
         self.NumSim.setText(QCoreApplication.translate("MainWindow", u"No. of Simulations", None))
         self.NumSimMax_Button.setText(QCoreApplication.translate("MainWindow", u"Max", None))
-        ___qtablewidgetitem = self.tableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Black Scholes", None));
-        ___qtablewidgetitem1 = self.tableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Binomial Tree", None));
-        ___qtablewidgetitem2 = self.tableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"Monte Carlo", None));
-        ___qtablewidgetitem3 = self.tableWidget.verticalHeaderItem(0)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"Call Price", None));
-        ___qtablewidgetitem4 = self.tableWidget.verticalHeaderItem(1)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"Put Price", None));
+#if QT_CONFIG(tooltip)
+        self.Stop_Button.setToolTip(QCoreApplication.translate("MainWindow", u"Stop refining the Binomial Tree and Monte Carlo results", None))
+#endif // QT_CONFIG(tooltip)
+        self.Stop_Button.setText(QCoreApplication.translate("MainWindow", u"Stop", None))
+        self.Chart_GroupBox.setTitle(QCoreApplication.translate("MainWindow", u"Sensitivity Chart", None))
+        self.ChartParameter.setText(QCoreApplication.translate("MainWindow", u"Vary", None))
+        self.ChartQuantity.setText(QCoreApplication.translate("MainWindow", u"Show", None))
         self.EuropeanStyle_RadioButton.setText(QCoreApplication.translate("MainWindow", u"European", None))
         self.AmericanStyle_RadioButton.setText(QCoreApplication.translate("MainWindow", u"American", None))
         self.PricingModel_GroupBox.setTitle(QCoreApplication.translate("MainWindow", u"Pricing Model", None))
@@ -1,5 +1,7 @@
 import pytest
-from option_pricing.core.binomial_tree import bt_price
+import numpy as np
+from option_pricing.core.black_scholes import bs_greeks_batch
+from option_pricing.core.binomial_tree import bt_greeks_batch, bt_price, bt_price_batch
 
 
 class TestBinomialTree:
@@ -32,3 +34,49 @@ class TestBinomialTree:
         european = bt_price(S=100, K=110, T=1, r=0.05, sigma=0.2, steps=100, option_type=0, style='european')
         american = bt_price(S=100, K=110, T=1, r=0.05, sigma=0.2, steps=100, option_type=0, style='american')
         assert american >= european
+
+    def test_batch_matches_scalar(self):
+        """Test vectorized pricing matches bt_price contract by contract"""
+        K = np.array([90.0, 100.0, 110.0])
+        steps = np.array([50, 100, 150])
+        prices = bt_price_batch(100, K, 1, 0.05, 0.2, steps, 0, style='american')
+        assert prices.shape == (3,)
+        for i in range(len(K)):
+            assert abs(prices[i] - bt_price(100, K[i], 1, 0.05, 0.2, steps[i], 0, style='american')) < 1e-10
+
+    def test_batch_rejects_zero_steps(self):
+        """Test a tree without steps raises instead of returning garbage"""
+        with pytest.raises(ValueError):
+            bt_price_batch(100, 100, 1, 0.05, 0.2, np.array([100, 0]))
+
+    def test_greeks_batch_close_to_black_scholes(self):
+        """Test European lattice Greeks converge to the Black-Scholes Greeks"""
+        S = np.array([80.0, 100.0, 120.0])
+        for option_type in (1, 0):
+            greeks = bt_greeks_batch(S, 100, 1, 0.05, 0.2, 500, option_type)
+            reference = bs_greeks_batch(S, 100, 1, 0.05, 0.2, option_type)
+            for key in reference:
+                assert np.allclose(greeks[key], reference[key], rtol=5e-3, atol=1e-2), key
+
+    def test_greeks_batch_shared_lattice(self):
+        """Test sharing one lattice across spots matches building one per contract"""
+        S = np.linspace(80, 120, 7)
+        shared = bt_greeks_batch(S, 100, 1, 0.05, 0.2, 200, 0, style='american')
+        separate = bt_greeks_batch(S, 100, np.ones(7), 0.05, 0.2, 200, 0, style='american')
+        for key in shared:
+            assert np.allclose(shared[key], separate[key], rtol=1e-10, atol=1e-12)
+        assert abs(shared['Price'][3] - bt_price(100, 100, 1, 0.05, 0.2, 200, 0, style='american')) < 1e-10
+
+    def test_greeks_batch_two_steps(self):
+        """Test the smallest tree reads Gamma and Theta off its maturity nodes"""
+        greeks = bt_greeks_batch(100, 100, 1, 0.05, 0.2, steps=2)
+        u = np.exp(0.2 * np.sqrt(0.5))
+        gamma = (100 * u**2 - 100) / (100 * (u**2 - 1)) / (0.5 * 100 * (u**2 - u**-2))
+        assert abs(greeks['Gamma'] - gamma) < 1e-10
+        # The middle maturity node is at the money and worth nothing
+        assert abs(greeks['Theta'] + greeks['Price']) < 1e-10
+
+    def test_greeks_batch_rejects_short_tree(self):
+        """Test lattice Greeks need at least two steps"""
+        with pytest.raises(ValueError):
+            bt_greeks_batch(100, 100, 1, 0.05, 0.2, steps=1)
@@ -1,5 +1,6 @@
 import pytest
-from option_pricing.core.black_scholes import bs_price, bs_greeks
+import numpy as np
+from option_pricing.core.black_scholes import bs_price, bs_greeks, bs_price_batch, bs_greeks_batch
 
 
 class TestBlackScholes:
@@ -33,3 +34,30 @@ class TestBlackScholes:
         import math
         parity_diff = call - put - (S - K * math.exp(-r * T))
         assert abs(parity_diff) < 0.01
+
+    def test_batch_matches_scalar(self):
+        """Test vectorized prices and Greeks match the scalar functions"""
+        S = np.array([80.0, 100.0, 120.0])
+        option_type = np.array([1, 0, 1])
+        prices = bs_price_batch(S, 100, 1, 0.05, 0.2, option_type)
+        greeks = bs_greeks_batch(S, 100, 1, 0.05, 0.2, option_type)
+        for i in range(len(S)):
+            expected = bs_greeks(S[i], 100, 1, 0.05, 0.2, option_type[i])
+            assert abs(prices[i] - expected['Price']) < 1e-10
+            for key, value in expected.items():
+                assert abs(greeks[key][i] - value) < 1e-10
+
+    def test_batch_degenerate_contracts(self):
+        """Test expired contracts price at intrinsic value with NaN Greeks"""
+        greeks = bs_greeks_batch(110, 100, np.array([0.0, 1.0]), 0.05, 0.2, 1)
+        assert greeks['Price'][0] == bs_price(110, 100, 0, 0.05, 0.2, 1)
+        assert np.isnan(greeks['Delta'][0])
+        assert not np.isnan(greeks['Delta'][1])
+
+    def test_put_theta(self):
+        """Test put Theta matches the finite difference in time to maturity"""
+        h = 1e-5
+        theta = bs_greeks(S=80, K=100, T=1, r=0.05, sigma=0.2, option_type=0)['Theta']
+        numeric = -(bs_price(80, 100, 1 + h, 0.05, 0.2, 0) - bs_price(80, 100, 1 - h, 0.05, 0.2, 0)) / (2 * h)
+        assert abs(theta - numeric) < 1e-4
+        assert abs(bs_greeks_batch(80, 100, 1, 0.05, 0.2, 0)['Theta'] - numeric) < 1e-4
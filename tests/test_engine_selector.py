@@ -0,0 +1,94 @@
+import pytest
+from option_pricing.controller.engine_selector import CostModel
+from option_pricing.controller.pricing_service import PricingService
+from option_pricing.core.black_scholes import bs_price
+from option_pricing.core.binomial_tree import bt_price
+
+PARAMS = {'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.05, 'sigma': 0.2}
+
+
+class TestCostModel:
+    def test_closed_form_preferred_for_european(self):
+        """Test Black-Scholes wins when it is the cheapest way to meet the target"""
+        model = CostModel({'bs_time': 1e-6})
+        choice = model.choose(PARAMS, 1, 'european', target_error=1e-4, time_budget=1.0)
+        assert choice.engine == 'bs'
+        assert choice.estimated_error == 0.0
+
+    def test_american_uses_binomial(self):
+        """Test American contracts get the smallest tree meeting the target"""
+        model = CostModel()
+        loose = model.choose(PARAMS, 0, 'american', target_error=1e-2, time_budget=1.0)
+        tight = model.choose(PARAMS, 0, 'american', target_error=1e-3, time_budget=1.0)
+        assert loose.engine == tight.engine == 'bt'
+        assert loose.resolution < tight.resolution
+        assert tight.estimated_error <= 1e-3
+
+    def test_resolution_meets_target_despite_rounding(self):
+        """Test a target hit exactly up to float rounding keeps the smallest tree"""
+        model = CostModel()
+        params = dict(PARAMS, K=200.0)
+        steps = model.resolution_for_error('bt', params, 0, 1e-4)
+        assert model.estimate_error('bt', params, 0, 'american', steps) <= 1e-4
+        choice = model.choose(params, 0, 'american', target_error=1e-4, time_budget=1.0)
+        assert choice.resolution == steps
+        assert choice.resolution < 1200
+
+    def test_budget_limits_resolution(self):
+        """Test an unreachable target falls back to the best configuration within budget"""
+        model = CostModel()
+        choice = model.choose(PARAMS, 1, 'european', target_error=1e-6, time_budget=0.01, engines=('mc',))
+        assert choice.estimated_time <= 0.01 + 1e-12
+        assert choice.estimated_error > 1e-6
+
+    def test_binomial_error_model_is_conservative(self):
+        """Test predicted binomial error bounds the actual error for typical contracts"""
+        model = CostModel()
+        for K in (90.0, 100.0, 110.0):
+            for T in (0.5, 1.0):
+                params = dict(PARAMS, K=K, T=T)
+                steps = model.resolution_for_error('bt', params, 1, 1e-2)
+                exact = bs_price(100, K, T, 0.05, 0.2, 1)
+                assert abs(bt_price(100, K, T, 0.05, 0.2, steps, 1, 'european') - exact) <= 1e-2
+
+    def test_record_refines_timings(self):
+        """Test recorded run times move the cost model after the warm-up observation"""
+        model = CostModel()
+        before = model.coefficients['bt_american_time']
+        predicted = model.estimate_time('bt', 'american', 1000)
+        model.record('bt', 'american', 1000, predicted * 10)
+        assert model.coefficients['bt_american_time'] == before
+        model.record('bt', 'american', 1000, predicted * 10)
+        assert model.coefficients['bt_american_time'] > before
+
+    def test_overhead_does_not_inflate_slope(self):
+        """Test repeated small trees, dominated by call overhead, leave the per-node cost alone"""
+        model = CostModel()
+        before = model.coefficients['bt_american_time']
+        for _ in range(12):
+            model.record('bt', 'american', 10, 1e-5)
+        assert model.coefficients['bt_american_time'] == before
+        budget = 0.05
+        steps = model.resolution_for_time('bt', 'american', budget)
+        assert model.estimate_time('bt', 'american', steps) <= budget
+
+    def test_save_and_load(self, tmp_path):
+        """Test coefficients round-trip through a JSON file"""
+        model = CostModel({'mc_time': 1e-7})
+        model.save(str(tmp_path / 'model.json'))
+        assert CostModel.load(str(tmp_path / 'model.json')).coefficients == model.coefficients
+
+
+class TestCalculateAuto:
+    def test_reports_choice(self):
+        """Test the automatic mode prices and reports its configuration"""
+        result = PricingService.calculate_auto(PARAMS, target_error=1e-3, time_budget=1.0, option_type=0,
+                                               style='american')
+        assert result['engine'] == 'bt'
+        assert result['met_target']
+        assert abs(result['price'] - bt_price(100, 100, 1, 0.05, 0.2, 5000, 0, 'american')) < 1e-3
+        assert result['elapsed'] > 0
+
+    def test_invalid_request(self):
+        """Test impossible engine choices return None"""
+        assert PricingService.calculate_auto(PARAMS, 1e-3, 1.0, style='american', engines=('mc',)) is None
@@ -1,5 +1,7 @@
 import pytest
-from option_pricing.core.monte_carlo import mc_price
+import numpy as np
+from option_pricing.core.black_scholes import bs_greeks_batch, bs_price_batch
+from option_pricing.core.monte_carlo import mc_greeks_batch, mc_price, mc_price_batch
 
 
 class TestMonteCarlo:
@@ -24,3 +26,50 @@ class TestMonteCarlo:
         """Test deep out-of-the-money call"""
         price = mc_price(S=80, K=100, T=1, r=0.05, sigma=0.2, num_simulations=10000, option_type=1)
         assert price < 5  # Should be relatively cheap
+
+    def test_batch_close_to_black_scholes(self):
+        """Test vectorized Monte Carlo converges to Black-Scholes per contract"""
+        S = np.array([[90.0], [110.0]])
+        option_type = np.array([1, 0])
+        prices = mc_price_batch(S, 100, 1, 0.05, 0.2, 200000, option_type)
+        assert prices.shape == (2, 2)
+        assert np.allclose(prices, bs_price_batch(S, 100, 1, 0.05, 0.2, option_type), atol=0.1)
+
+    def test_float32_accuracy(self):
+        """Test single-precision paths stay within Monte Carlo error of float64"""
+        reference = bs_price_batch(100, 100, 1, 0.05, 0.2, 1)
+        price = mc_price(S=100, K=100, T=1, r=0.05, sigma=0.2, num_simulations=2000000, option_type=1,
+                         precision='float32')
+        assert abs(price - reference) < 0.05
+        prices = mc_price_batch(100, np.array([90.0, 110.0]), 1, 0.05, 0.2, 1000000, 0, precision='float32')
+        assert prices.dtype == np.float64
+        assert np.allclose(prices, bs_price_batch(100, np.array([90.0, 110.0]), 1, 0.05, 0.2, 0), atol=0.05)
+
+    def test_batch_rejects_unknown_precision(self):
+        """Test unsupported precision names raise ValueError"""
+        with pytest.raises(ValueError):
+            mc_price_batch(100, 100, 1, 0.05, 0.2, 1000, precision='float16')
+
+    def test_batch_rejects_too_few_paths(self):
+        """Test fewer than one antithetic pair raises ValueError"""
+        with pytest.raises(ValueError):
+            mc_price_batch(100, 100, 1, 0.05, 0.2, np.array([1000, 1]))
+
+    def test_greeks_batch_close_to_black_scholes(self):
+        """Test Monte Carlo Greeks are within sampling error of Black-Scholes"""
+        S = np.array([90.0, 100.0, 110.0])
+        for option_type in (1, 0):
+            greeks = mc_greeks_batch(S, 100, 1, 0.05, 0.2, 400000, option_type)
+            reference = bs_greeks_batch(S, 100, 1, 0.05, 0.2, option_type)
+            for key in reference:
+                assert np.allclose(greeks[key], reference[key], rtol=2e-2, atol=2e-2), key
+
+    def test_greeks_batch_common_random_numbers(self):
+        """Test every contract is priced on the same paths, seeded reproducibly"""
+        S = np.linspace(90, 110, 5)
+        shared = mc_greeks_batch(S, 100, 1, 0.05, 0.2, 20000, 1, seed=7)
+        separate = mc_greeks_batch(S, 100, np.ones(5), 0.05, 0.2, 20000, 1, seed=7)
+        for key in shared:
+            assert np.allclose(shared[key], separate[key])
+        # Same draws: the price curve is monotone even with few paths
+        assert np.all(np.diff(shared['Price']) > 0)
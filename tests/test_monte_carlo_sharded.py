@@ -0,0 +1,78 @@
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from option_pricing.core.black_scholes import bs_greeks
+from option_pricing.core.monte_carlo_sharded import McStatistics, mc_price_sharded, mc_shard, shard_seed
+
+ARGS = (100, 100, 1, 0.05, 0.2)
+
+
+class TestShardedMonteCarlo:
+    def test_shard_is_deterministic(self):
+        """Test a shard depends only on its seed"""
+        a = mc_shard(*ARGS, 10000, seed=7)
+        b = mc_shard(*ARGS, 10000, seed=7)
+        c = mc_shard(*ARGS, 10000, seed=8)
+        assert a.count == 5000
+        assert a.to_dict() == b.to_dict()
+        assert a.to_dict() != c.to_dict()
+
+    def test_merge_combines_statistics(self):
+        """Test merging adds counts and accumulators"""
+        a = mc_shard(*ARGS, 1000, seed=1)
+        b = mc_shard(*ARGS, 3000, seed=2)
+        merged = a.merge(b)
+        assert merged.count == 2000
+        assert merged.estimates()['Price'] == pytest.approx((a.sums[0] + b.sums[0]) / 2000)
+        assert McStatistics.from_dict(merged.to_dict()).to_dict() == merged.to_dict()
+
+    def test_independent_of_worker_count(self):
+        """Test the merged result does not depend on how shards are scheduled"""
+        with ThreadPoolExecutor(1) as one, ThreadPoolExecutor(4) as four:
+            a = mc_price_sharded(*ARGS, 100000, shard_paths=15000, seed=3, executor=one)
+            b = mc_price_sharded(*ARGS, 100000, shard_paths=15000, seed=3, executor=four)
+        assert a.to_dict() == b.to_dict()
+        assert a.count == 50000
+
+    def test_converges_to_black_scholes(self):
+        """Test price and Greeks agree with closed form"""
+        with ThreadPoolExecutor(4) as executor:
+            stats = mc_price_sharded(*ARGS, 2_000_000, option_type=0, shard_paths=500_000, executor=executor)
+        expected = bs_greeks(*ARGS, option_type=0)
+        estimates, stderrs = stats.estimates(), stats.stderrs()
+        for name in ('Price', 'Delta', 'Gamma', 'Vega', 'Theta', 'Rho'):
+            assert abs(estimates[name] - expected[name]) < 5 * stderrs[name]
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        """Test an interrupted run resumes from saved shards with identical results"""
+        with ThreadPoolExecutor(2) as executor:
+            full = mc_price_sharded(*ARGS, 40000, shard_paths=10000, seed=5, checkpoint_dir=str(tmp_path),
+                                    executor=executor)
+            shard_files = sorted(f for f in os.listdir(tmp_path) if f.startswith('shard_'))
+            assert len(shard_files) == 4
+
+            # Simulate an interruption by dropping half the completed shards.
+            for name in shard_files[::2]:
+                os.remove(tmp_path / name)
+            resumed = mc_price_sharded(*ARGS, 40000, shard_paths=10000, seed=5, checkpoint_dir=str(tmp_path),
+                                       executor=executor)
+            assert resumed.to_dict() == full.to_dict()
+
+            with pytest.raises(ValueError):
+                mc_price_sharded(*ARGS, 40000, shard_paths=10000, seed=6, checkpoint_dir=str(tmp_path),
+                                 executor=executor)
+
+    def test_shard_seeds_are_distinct(self):
+        """Test shard seeds differ across shards and runs"""
+        seeds = {shard_seed(seed, index) for seed in range(3) for index in range(100)}
+        assert len(seeds) == 300
+
+    def test_float32_matches_float64_statistics(self):
+        """Test single-precision shards agree with float64 shards on the same draws"""
+        ref = mc_shard(*ARGS, 200000, seed=9)
+        fast = mc_shard(*ARGS, 200000, seed=9, precision='float32')
+        assert fast.count == ref.count
+        ref_est, fast_est = ref.estimates(), fast.estimates()
+        for name in ref_est:
+            # Same normal draws, so only float32 rounding separates the runs.
+            assert fast_est[name] == pytest.approx(ref_est[name], rel=1e-5)
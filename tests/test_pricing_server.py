@@ -0,0 +1,140 @@
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from option_pricing.core.black_scholes import bs_price
+from option_pricing.core.binomial_tree import bt_price
+from option_pricing.server import MicroBatcher, PricingClient, PricingServer, PricingServerError
+from option_pricing.server.pricing_server import _warm_up
+
+CONTRACT = {'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.05, 'sigma': 0.2}
+
+
+async def _with_server(scenario, **kwargs):
+    # numba's TBB layer can hang at exit if its first parallel launch is on
+    # a pool thread, so compile and launch the kernels here first.
+    _warm_up()
+    with ThreadPoolExecutor(2) as executor:
+        async with PricingServer(port=0, executor=executor, **kwargs) as server:
+            async with PricingClient(server.host, server.port) as client:
+                return await scenario(client)
+
+
+class TestMicroBatcher:
+    def test_coalesces_concurrent_requests(self):
+        """Test concurrent submissions are run as one batch per key"""
+        batches = []
+
+        async def run_batch(key, items):
+            batches.append((key, items))
+            return [item * 2 for item in items]
+
+        async def scenario():
+            batcher = MicroBatcher(run_batch, max_batch_size=100, max_delay=0.01)
+            results = await asyncio.gather(*(batcher.submit('a', i) for i in range(5)),
+                                           batcher.submit('b', 10))
+            await batcher.close()
+            return results
+
+        assert asyncio.run(scenario()) == [0, 2, 4, 6, 8, 20]
+        assert sorted(batches) == [('a', [0, 1, 2, 3, 4]), ('b', [10])]
+
+    def test_flushes_at_max_batch_size(self):
+        """Test a full batch is dispatched without waiting for the delay"""
+        sizes = []
+
+        async def run_batch(key, items):
+            sizes.append(len(items))
+            return items
+
+        async def scenario():
+            batcher = MicroBatcher(run_batch, max_batch_size=3, max_delay=10.0)
+            return await asyncio.wait_for(asyncio.gather(*(batcher.submit('a', i) for i in range(6))), 1.0)
+
+        assert asyncio.run(scenario()) == list(range(6))
+        assert sizes == [3, 3]
+
+
+class TestPricingServer:
+    def test_price_matches_core(self):
+        """Test batched single-contract prices match the scalar engines"""
+        async def scenario(client):
+            return await asyncio.gather(
+                client.price('bs', **CONTRACT, option_type=0),
+                client.price('bt', **CONTRACT, steps=50, style='american', option_type=0),
+            )
+
+        bs, bt = asyncio.run(_with_server(scenario))
+        assert abs(bs - bs_price(100, 100, 1, 0.05, 0.2, 0)) < 1e-10
+        assert abs(bt - bt_price(100, 100, 1, 0.05, 0.2, 50, 0, 'american')) < 1e-10
+
+    def test_price_batch_and_service(self):
+        """Test column batches and PricingService methods are exposed"""
+        async def scenario(client):
+            batch = await client.request('price_batch', {'engine': 'bs', **CONTRACT, 'K': [90, 100, 110]})
+            service = await client.request('calculate_bs', {'params': CONTRACT})
+            return batch, service
+
+        batch, service = asyncio.run(_with_server(scenario))
+        assert len(batch) == 3
+        assert service['call'] == round(bs_price(100, 100, 1, 0.05, 0.2, 1), 4)
+
+    def test_errors(self):
+        """Test unknown methods, missing parameters and timeouts are reported"""
+        async def scenario(client):
+            errors = []
+            for method, params, timeout in [
+                ('nope', {}, None),
+                ('price', {'engine': 'bs', 'S': 100.0}, None),
+                ('price', {'engine': 'mc', **CONTRACT, 'num_simulations': 10**8}, 0.01),
+            ]:
+                with pytest.raises(PricingServerError) as info:
+                    await client.request(method, params, timeout)
+                errors.append(info.value.error_type)
+            return errors
+
+        assert asyncio.run(_with_server(scenario, max_delay=0.0)) == ['bad_request', 'bad_request', 'timeout']
+
+    def test_bad_request_does_not_fail_batch(self):
+        """Test an invalid contract is rejected alone, not with the batch it arrived with"""
+        async def scenario(client):
+            return await asyncio.gather(
+                client.price('bs', **CONTRACT),
+                client.price('bs', **{**CONTRACT, 'S': 'abc'}),
+                client.price('bs', **{**CONTRACT, 'S': [1, 2]}),
+                client.price('bt', **CONTRACT, steps=0),
+                client.price('bt', **CONTRACT, steps=50),
+                return_exceptions=True,
+            )
+
+        bs, text, array, no_steps, bt = asyncio.run(_with_server(scenario, max_delay=0.05))
+        assert abs(bs - bs_price(100, 100, 1, 0.05, 0.2, 1)) < 1e-10
+        assert abs(bt - bt_price(100, 100, 1, 0.05, 0.2, 50, 1)) < 1e-10
+        for error in (text, array, no_steps):
+            assert isinstance(error, PricingServerError)
+            assert error.error_type == 'bad_request'
+
+    def test_idle_connections_hold_no_slots(self):
+        """Test connected but silent clients do not block other clients"""
+        async def scenario(client):
+            idle = [await asyncio.open_connection(client.host, client.port) for _ in range(3)]
+            try:
+                return await client.request('ping', timeout=3.0), await client.price('bs', **CONTRACT)
+            finally:
+                for _, writer in idle:
+                    writer.close()
+
+        pong, price = asyncio.run(asyncio.wait_for(_with_server(scenario, max_pending=2), 10.0))
+        assert pong == 'pong'
+        assert abs(price - bs_price(100, 100, 1, 0.05, 0.2, 1)) < 1e-10
+
+    def test_precision_option(self):
+        """Test the precision option reaches the batch engines"""
+        async def scenario(client):
+            return await asyncio.gather(
+                client.price('mc', **CONTRACT, num_simulations=1000000, precision='float32'),
+                client.request('price_batch', {'engine': 'mc', **CONTRACT, 'K': [90, 110], 'precision': 'float32'}),
+            )
+
+        single, batch = asyncio.run(_with_server(scenario))
+        assert single == pytest.approx(bs_price(100, 100, 1, 0.05, 0.2, 1), abs=0.05)
+        assert len(batch) == 2
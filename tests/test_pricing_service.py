@@ -0,0 +1,43 @@
+import numpy as np
+from option_pricing.controller.pricing_service import PricingService
+from option_pricing.core.black_scholes import bs_greeks_batch
+
+PARAMS = {'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.05, 'sigma': 0.2}
+
+
+class TestCalculateSweep:
+    def test_one_parameter(self):
+        """Test a 1-D sweep returns a curve per Greek on the given grid"""
+        grid = np.linspace(80, 120, 11)
+        result = PricingService.calculate_sweep(PARAMS, {'S': grid}, 'bs', option_type=0)
+        assert np.array_equal(result['axes']['S'], grid)
+        reference = bs_greeks_batch(grid, 100, 1, 0.05, 0.2, 0)
+        for key in reference:
+            assert result[key].shape == (11,)
+            assert np.allclose(result[key], reference[key])
+
+    def test_two_parameters(self):
+        """Test a 2-D sweep is indexed in the order of vary"""
+        S, sigma = np.linspace(80, 120, 5), np.linspace(0.1, 0.4, 4)
+        result = PricingService.calculate_sweep(PARAMS, {'sigma': sigma, 'S': S}, 'bt', time_steps=100)
+        assert result['Price'].shape == (4, 5)
+        expected = bs_greeks_batch(S[None, :], 100, 1, 0.05, sigma[:, None], 1)['Price']
+        assert np.allclose(result['Price'], expected, atol=0.05)
+
+    def test_engines_agree(self):
+        """Test the three engines give matching surfaces for European options"""
+        vary = {'K': np.linspace(90, 110, 5)}
+        bs = PricingService.calculate_sweep(PARAMS, vary, 'bs')
+        bt = PricingService.calculate_sweep(PARAMS, vary, 'bt', time_steps=400)
+        mc = PricingService.calculate_sweep(PARAMS, vary, 'mc', num_sim=400000)
+        for key in ('Price', 'Delta', 'Vega'):
+            # Lattice Vega inherits the odd/even oscillation of the tree
+            assert np.allclose(bt[key], bs[key], rtol=2e-2, atol=2e-2)
+            assert np.allclose(mc[key], bs[key], rtol=2e-2, atol=2e-2)
+
+    def test_invalid_sweep(self):
+        """Test invalid sweeps return None"""
+        assert PricingService.calculate_sweep(PARAMS, {'x': [1.0]}) is None
+        assert PricingService.calculate_sweep(PARAMS, {'S': [1.0], 'K': [1.0], 'T': [1.0]}) is None
+        assert PricingService.calculate_sweep(PARAMS, {'S': [100.0]}, 'bs', style='american') is None
+        assert PricingService.calculate_sweep(PARAMS, {'S': [100.0]}, 'xx') is None
@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+from option_pricing.core.black_scholes import bs_price
+from option_pricing.core.binomial_tree import bt_price
+from option_pricing.core.progressive import bt_price_progressive, mc_price_progressive
+
+
+class TestProgressive:
+    def test_mc_refines_towards_black_scholes(self):
+        """Test Monte Carlo estimates grow in paths and shrink in error"""
+        estimates = list(mc_price_progressive(S=100, K=100, T=1, r=0.05, sigma=0.2, num_simulations=1000000,
+                                              option_type=1))
+        paths = [e.resolution for e in estimates]
+        errors = [e.error for e in estimates]
+        assert paths == sorted(paths) and paths[-1] == 1000000
+        assert errors == sorted(errors, reverse=True)
+        assert abs(estimates[-1].price - bs_price(100, 100, 1, 0.05, 0.2, 1)) < 3 * errors[-1]
+
+    def test_mc_stops_at_tolerance(self):
+        """Test Monte Carlo stops once the confidence half-width is small enough"""
+        estimates = list(mc_price_progressive(100, 100, 1, 0.05, 0.2, 10000000, 0, tolerance=0.05))
+        assert estimates[-1].error <= 0.05
+        assert estimates[-1].resolution < 10000000
+
+    def test_bt_extrapolation_converges(self):
+        """Test binomial levels double up to the requested steps and converge"""
+        estimates = list(bt_price_progressive(100, 110, 1, 0.05, 0.2, steps=800, option_type=0, style='american'))
+        assert [e.resolution for e in estimates] == [25, 50, 100, 200, 400, 800]
+        reference = bt_price(100, 110, 1, 0.05, 0.2, 5000, 0, 'american')
+        assert abs(estimates[-1].price - reference) < 1e-3
+        assert abs(estimates[-1].price - reference) < abs(estimates[0].price - reference)
+
+    def test_bt_ends_on_the_plain_tree(self):
+        """Test the last binomial estimate is the requested tree, not the extrapolation"""
+        estimates = list(bt_price_progressive(100, 110, 1, 0.05, 0.2, steps=800, option_type=0, style='american'))
+        assert estimates[-1].price == pytest.approx(bt_price(100, 110, 1, 0.05, 0.2, 800, 0, 'american'), abs=1e-12)
+        assert 0 < estimates[-1].error < 0.01
+
+    def test_bt_small_step_counts(self):
+        """Test step counts below the first level still produce one estimate"""
+        estimates = list(bt_price_progressive(100, 100, 1, 0.05, 0.2, steps=5))
+        assert len(estimates) == 1
+        assert estimates[0].resolution == 5
+        assert estimates[0].price == pytest.approx(bt_price(100, 100, 1, 0.05, 0.2, 5), abs=1e-12)
+        assert estimates[0].error > 0
+
+    def test_cancel_stops_generators(self):
+        """Test a set cancel event ends both generators before their next estimate"""
+        for make in (lambda cancel: bt_price_progressive(100, 100, 1, 0.05, 0.2, steps=20000, cancel=cancel),
+                     lambda cancel: mc_price_progressive(100, 100, 1, 0.05, 0.2, 10000000, cancel=cancel)):
+            cancel = threading.Event()
+            estimates = make(cancel)
+            next(estimates)
+            cancel.set()
+            assert list(estimates) == []
@@ -0,0 +1,91 @@
+import time
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+from PySide6.QtCore import Qt
+from option_pricing.controller.results_model import ResultsTableModel
+
+
+def _record_changes(model):
+    ranges = []
+    model.dataChanged.connect(lambda tl, br, roles: ranges.append(((tl.row(), tl.column()), (br.row(), br.column()))))
+    return ranges
+
+
+class TestResultsTableModel:
+    def test_display_and_headers(self):
+        """Test cells are formatted on demand and NaN cells show empty"""
+        model = ResultsTableModel([[1.23456, np.nan]], ["Call"], ["BS", "MC"], decimals=2)
+        assert model.rowCount() == 1 and model.columnCount() == 2
+        assert model.data(model.index(0, 0)) == "1.23"
+        assert model.data(model.index(0, 1)) == ""
+        assert model.data(model.index(0, 0), Qt.UserRole) == 1.23456
+        assert model.headerData(0, Qt.Horizontal) == "BS"
+        assert model.headerData(0, Qt.Vertical) == "Call"
+
+    def test_only_changed_ranges_signalled(self):
+        """Test a reprice emits dataChanged only for runs of changed cells"""
+        values = np.zeros((10, 3))
+        model = ResultsTableModel(values)
+        ranges = _record_changes(model)
+
+        new = values.copy()
+        new[2:4, 1] = 1.0
+        new[7, 2] = 1.0
+        model.set_values(new)
+        assert ranges == [((2, 1), (3, 1)), ((7, 2), (7, 2))]
+
+        ranges.clear()
+        model.set_values(new.copy())
+        assert ranges == []
+
+    def test_sort_and_filter_without_copying(self):
+        """Test sorting and filtering reorder view rows, not the backing array"""
+        values = np.array([[3.0], [1.0], [np.nan], [2.0]])
+        model = ResultsTableModel(values, row_labels=["a", "b", "c", "d"])
+
+        model.sort(0, Qt.AscendingOrder)
+        assert [model.headerData(i, Qt.Vertical) for i in range(4)] == ["b", "d", "a", "c"]
+        model.sort(0, Qt.DescendingOrder)
+        assert [model.headerData(i, Qt.Vertical) for i in range(4)] == ["a", "d", "b", "c"]
+
+        model.set_filter(values[:, 0] > 1.5)
+        assert model.rowCount() == 2
+        assert [model.source_row(i) for i in range(2)] == [0, 3]
+        assert model.values is values
+
+        model.set_filter(None)
+        assert model.rowCount() == 4
+
+    def test_changed_rows_follow_sort_order(self):
+        """Test dataChanged rows are reported in view coordinates"""
+        model = ResultsTableModel(np.array([[3.0, 0.0], [1.0, 0.0], [2.0, 0.0]]))
+        model.sort(0)
+        ranges = _record_changes(model)
+        model.set_column(1, [0.0, 5.0, 0.0])
+        assert ranges == [((0, 1), (0, 1))]
+
+    def test_large_table_updates(self):
+        """Test 100k-row updates stay cheap"""
+        values = np.random.default_rng(0).random((100_000, 8))
+        model = ResultsTableModel(values)
+        model.sort(3)
+        ranges = _record_changes(model)
+
+        new = values.copy()
+        new[::1000, 5] += 1.0
+        start = time.perf_counter()
+        model.set_values(new)
+        assert time.perf_counter() - start < 0.5
+        assert len(ranges) == 1  # scattered changes collapse into one bounding range
+        assert model.data(model.index(99_999, 7)) != ""
+
+    def test_error_bars(self):
+        """Test error bars are displayed and count as changes"""
+        model = ResultsTableModel([[1.0, 2.0]], decimals=2)
+        ranges = _record_changes(model)
+        model.set_column(1, [2.0], [0.125])
+        assert model.data(model.index(0, 1)) == "2.00 ± 0.12"
+        assert model.data(model.index(0, 0)) == "1.00"
+        assert ranges == [((0, 1), (0, 1))]